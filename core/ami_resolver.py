@@ -5,7 +5,7 @@ AMI resolver that combines GitHub client and HTML parser to find AMI information
 from typing import List, Optional, Tuple, Dict
 from core.github_client import GitHubReleaseClient, GitHubAPIError
 from core.html_parser import EKSReleaseHTMLParser, ReleaseParsingError
-from models.ami_types import AMIType, Architecture, AMITypeManager
+from models.ami_types import AMIType, Architecture, AMITypeManager, version_tuple
 
 
 class AMIResolutionError(Exception):
@@ -16,15 +16,16 @@ class AMIResolutionError(Exception):
 class EKSAMIResolver:
     """High-level resolver for EKS AMI information."""
     
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, refresh_cache: bool = False):
         """
         Initialize the AMI resolver.
         
         Args:
             verbose: Enable verbose logging
+            refresh_cache: Ignore cached GitHub responses and fetch fresh ones
         """
         self.verbose = verbose
-        self.github_client = GitHubReleaseClient(verbose=verbose)
+        self.github_client = GitHubReleaseClient(verbose=verbose, refresh_cache=refresh_cache)
         self.html_parser = EKSReleaseHTMLParser(verbose=verbose)
         self.ami_manager = AMITypeManager()
     
@@ -33,13 +34,30 @@ class EKSAMIResolver:
         if self.verbose:
             print(f"[AMI-RESOLVER-DEBUG] {message}")
     
-    def find_kmod_nvidia_version(self, k8s_version: str, ami_type: AMIType) -> Optional[Tuple[str, str, str]]:
+    def prefetch_releases(self) -> List[Dict]:
+        """
+        Fetch the release list once so several lookups can share it.
+        
+        Returns:
+            List of release dictionaries
+        
+        Raises:
+            AMIResolutionError: If the releases cannot be fetched
+        """
+        try:
+            return self.github_client.get_releases()
+        except GitHubAPIError as e:
+            raise AMIResolutionError(f"Failed to fetch releases: {e}")
+    
+    def find_kmod_nvidia_version(self, k8s_version: str, ami_type: AMIType,
+                                 releases: Optional[List[Dict]] = None) -> Optional[Tuple[str, str, str]]:
         """
         Find the first kmod-nvidia-latest-dkms version for the specified Kubernetes version and AMI type.
         
         Args:
             k8s_version: Kubernetes version (e.g., "1.32")
             ami_type: AMI type to search for
+            releases: Release list from prefetch_releases(); fetched when omitted
         
         Returns:
             Tuple of (release_tag, release_date, kmod_version) or None if not found
@@ -47,10 +65,8 @@ class EKSAMIResolver:
         Raises:
             AMIResolutionError: If resolution fails
         """
-        try:
-            releases = self.github_client.get_releases()
-        except GitHubAPIError as e:
-            raise AMIResolutionError(f"Failed to fetch releases: {e}")
+        if releases is None:
+            releases = self.prefetch_releases()
         
         for release in releases:
             release_tag = release.get('tag_name', '')
@@ -85,13 +101,15 @@ class EKSAMIResolver:
         
         return None
     
-    def find_latest_release_for_k8s(self, k8s_version: str, ami_type: AMIType) -> Optional[Tuple[str, str, str]]:
+    def find_latest_release_for_k8s(self, k8s_version: str, ami_type: AMIType,
+                                    releases: Optional[List[Dict]] = None) -> Optional[Tuple[str, str, str]]:
         """
         Find the latest (most recent) release for the specified Kubernetes version and AMI type.
         
         Args:
             k8s_version: Kubernetes version (e.g., "1.32")
             ami_type: AMI type to search for
+            releases: Release list from prefetch_releases(); fetched when omitted
         
         Returns:
             Tuple of (release_tag, release_date, kmod_version) or None if not found
@@ -99,10 +117,8 @@ class EKSAMIResolver:
         Raises:
             AMIResolutionError: If resolution fails
         """
-        try:
-            releases = self.github_client.get_releases()
-        except GitHubAPIError as e:
-            raise AMIResolutionError(f"Failed to fetch releases: {e}")
+        if releases is None:
+            releases = self.prefetch_releases()
         
         # Releases are typically ordered by date (newest first)
         for release in releases:
@@ -167,6 +183,10 @@ class EKSAMIResolver:
         
         matches = []
         
+        # Fuzzy matching is a case-insensitive substring test, so lower-case the query once;
+        # exact matching compares the strings as they are
+        needle = driver_version.lower() if fuzzy else driver_version
+        
         for release in releases:
             release_tag = release.get('tag_name', '')
             release_date = release.get('published_at', '')
@@ -198,15 +218,7 @@ class EKSAMIResolver:
                     
                     if kmod_version:
                         # Check for exact or fuzzy match
-                        version_matched = False
-                        if fuzzy:
-                            if driver_version.lower() in kmod_version.lower():
-                                version_matched = True
-                        else:
-                            if driver_version in kmod_version:
-                                version_matched = True
-                        
-                        if version_matched:
+                        if needle in (kmod_version.lower() if fuzzy else kmod_version):
                             matches.append((release_tag, release_date, k8s_ver, kmod_version, ami_type.value))
                             self.log(f"Found match: {release_tag} K8s {k8s_ver} {ami_type.value} {kmod_version}")
         
@@ -246,7 +258,7 @@ class EKSAMIResolver:
                 self.log(f"Failed to parse {release_tag}: {e}")
                 continue
         
-        return sorted(k8s_versions, key=lambda x: [int(i) for i in x.split('.')])
+        return sorted(k8s_versions, key=version_tuple)
     
     def debug_release(self, release_tag: str) -> Dict:
         """
@@ -5,12 +5,22 @@ AWS EKS Client for nodegroup management operations.
 import boto3
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 from models.ami_types import AMIType, Architecture, AMITypeManager
 
 
+# Shared by every AWS client: adaptive retries for throttling, pooled keep-alive connections
+AWS_CLIENT_CONFIG = Config(
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    max_pool_connections=20,
+    tcp_keepalive=True,
+)
+
+
 @dataclass
 class NodegroupInfo:
     """Information about an EKS nodegroup."""
@@ -83,6 +93,9 @@ class EKSClientError(Exception):
 class EKSClient:
     """AWS EKS client for nodegroup operations."""
     
+    # Upper bound on concurrent describe_nodegroup calls
+    MAX_DESCRIBE_WORKERS = 16
+    
     def __init__(self, profile: str = None, region: str = None, verbose: bool = False):
         """
         Initialize EKS client.
@@ -96,16 +109,11 @@ class EKSClient:
         self.ami_manager = AMITypeManager()
         
         try:
-            # Create session with profile if specified
-            if profile:
-                session = boto3.Session(profile_name=profile)
-                self.eks_client = session.client('eks', region_name=region)
-                self.ec2_client = session.client('ec2', region_name=region)
-                self.ssm_client = session.client('ssm', region_name=region)
-            else:
-                self.eks_client = boto3.client('eks', region_name=region)
-                self.ec2_client = boto3.client('ec2', region_name=region)
-                self.ssm_client = boto3.client('ssm', region_name=region)
+            # One session (credentials resolved once) shared by all clients
+            session = boto3.Session(profile_name=profile, region_name=region)
+            self.eks_client = session.client('eks', config=AWS_CLIENT_CONFIG)
+            self.ec2_client = session.client('ec2', config=AWS_CLIENT_CONFIG)
+            self.ssm_client = session.client('ssm', config=AWS_CLIENT_CONFIG)
             
             self.region = region
                 
@@ -128,8 +136,11 @@ class EKSClient:
         """
         try:
             self.log("Listing EKS clusters")
-            response = self.eks_client.list_clusters()
-            return response.get('clusters', [])
+            clusters = []
+            for page in self.eks_client.get_paginator('list_clusters').paginate(
+                    PaginationConfig={'PageSize': 100}):
+                clusters.extend(page.get('clusters', []))
+            return clusters
         except ClientError as e:
             raise EKSClientError(f"Failed to list clusters: {e}")
     
@@ -164,8 +175,11 @@ class EKSClient:
         """
         try:
             self.log(f"Listing nodegroups for cluster {cluster_name}")
-            response = self.eks_client.list_nodegroups(clusterName=cluster_name)
-            return response.get('nodegroups', [])
+            nodegroups = []
+            for page in self.eks_client.get_paginator('list_nodegroups').paginate(
+                    clusterName=cluster_name, PaginationConfig={'PageSize': 100}):
+                nodegroups.extend(page.get('nodegroups', []))
+            return nodegroups
         except ClientError as e:
             if e.response['Error']['Code'] == 'ResourceNotFoundException':
                 raise EKSClientError(f"Cluster '{cluster_name}' not found")
@@ -217,6 +231,27 @@ class EKSClient:
                 raise EKSClientError(f"Nodegroup '{nodegroup_name}' not found in cluster '{cluster_name}'")
             raise EKSClientError(f"Failed to get nodegroup info: {e}")
     
+    def get_nodegroups_info(self, cluster_name: str, nodegroup_names: List[str]) -> List[NodegroupInfo]:
+        """
+        Get detailed information for several nodegroups, describing them concurrently.
+        
+        Args:
+            cluster_name: Name of the cluster
+            nodegroup_names: Names of the nodegroups
+            
+        Returns:
+            NodegroupInfo objects in the same order as nodegroup_names
+        """
+        if len(nodegroup_names) <= 1:
+            return [self.get_nodegroup_info(cluster_name, name) for name in nodegroup_names]
+        
+        # boto3 clients are thread-safe, so the workers share this client
+        workers = min(self.MAX_DESCRIBE_WORKERS, len(nodegroup_names))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda name: self.get_nodegroup_info(cluster_name, name), nodegroup_names
+            ))
+    
     def get_gpu_nodegroups(self, cluster_name: str) -> List[NodegroupInfo]:
         """
         Get all GPU-enabled nodegroups in a cluster.
@@ -230,11 +265,10 @@ class EKSClient:
         gpu_nodegroups = []
         nodegroup_names = self.list_nodegroups(cluster_name)
         
-        for ng_name in nodegroup_names:
-            ng_info = self.get_nodegroup_info(cluster_name, ng_name)
+        for ng_info in self.get_nodegroups_info(cluster_name, nodegroup_names):
             if ng_info.is_gpu_nodegroup:
                 gpu_nodegroups.append(ng_info)
-                self.log(f"Found GPU nodegroup: {ng_name} (AMI: {ng_info.ami_type})")
+                self.log(f"Found GPU nodegroup: {ng_info.nodegroup_name} (AMI: {ng_info.ami_type})")
         
         return gpu_nodegroups
     
@@ -252,10 +286,7 @@ class EKSClient:
         """
         if nodegroup_names:
             # Extract specific nodegroups
-            configurations = []
-            for ng_name in nodegroup_names:
-                ng_info = self.get_nodegroup_info(cluster_name, ng_name)
-                configurations.append(ng_info)
+            configurations = self.get_nodegroups_info(cluster_name, nodegroup_names)
         else:
             # Extract all GPU nodegroups
             configurations = self.get_gpu_nodegroups(cluster_name)
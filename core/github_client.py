@@ -2,9 +2,18 @@
 GitHub API client for fetching EKS AMI release information.
 """
 
+import hashlib
+import os
+import threading
+import time
 import requests
 import sys
-from typing import List, Dict, Optional
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from utils import json_utils
+from utils.path_utils import get_cache_path
+from typing import Any, List, Dict, Optional
 
 
 class GitHubAPIError(Exception):
@@ -15,18 +24,26 @@ class GitHubAPIError(Exception):
 class GitHubReleaseClient:
     """Client for interacting with GitHub releases API."""
     
-    def __init__(self, repo: str = "awslabs/amazon-eks-ami", verbose: bool = False):
+    # Cached API responses are reused without a request for 10 minutes, then revalidated via ETag
+    CACHE_TTL_SECONDS = 10 * 60
+    
+    def __init__(self, repo: str = "awslabs/amazon-eks-ami", verbose: bool = False,
+                 refresh_cache: bool = False):
         """
         Initialize GitHub release client.
         
         Args:
             repo: GitHub repository in format "owner/repo"
             verbose: Enable verbose logging
+            refresh_cache: Ignore cached API responses and fetch fresh ones
         """
         self.repo = repo
         self.api_url = f"https://api.github.com/repos/{repo}/releases"
         self.session = requests.Session()
         self.verbose = verbose
+        self.refresh_cache = refresh_cache
+        # Responses already fetched or validated by this process, keyed by request URL
+        self._responses: Dict[str, Any] = {}
         self._setup_session()
     
     def _setup_session(self):
@@ -35,12 +52,109 @@ class GitHubReleaseClient:
             'User-Agent': 'EKS-AMI-Parser/2.0',
             'Accept': 'application/vnd.github.v3+json'
         })
+        
+        # Retry rate limiting and transient server errors with exponential backoff
+        retry = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods={"GET"}, respect_retry_after_header=True)
+        self.session.mount("https://", HTTPAdapter(max_retries=retry))
     
     def log(self, message: str):
         """Print verbose logging messages."""
         if self.verbose:
             print(f"[GITHUB-DEBUG] {message}")
     
+    def _get_json(self, url: str, params: Optional[Dict] = None) -> Optional[Any]:
+        """
+        GET a GitHub API URL and parse the JSON response, using the response cache.
+        
+        Args:
+            url: API URL
+            params: Query parameters
+        
+        Returns:
+            Parsed response, or None if the resource does not exist
+        
+        Raises:
+            requests.exceptions.RequestException, ValueError: If the request or parsing fails
+        """
+        cache_url = requests.Request('GET', url, params=params).prepare().url
+        if not self.refresh_cache and cache_url in self._responses:
+            return self._responses[cache_url]
+        
+        cache_key = f"github_{hashlib.sha1(cache_url.encode('utf-8')).hexdigest()}"
+        body_path = Path(get_cache_path(f"{cache_key}.json"))
+        meta_path = Path(get_cache_path(f"{cache_key}.meta.json"))
+        
+        meta = {}
+        if not self.refresh_cache and body_path.exists() and meta_path.exists():
+            try:
+                meta = json_utils.loads(meta_path.read_bytes())
+            except (OSError, ValueError):
+                meta = {}
+        
+        body = None
+        if meta and time.time() - meta.get('fetched_at', 0) < self.CACHE_TTL_SECONDS:
+            body = self._read_cached_body(body_path)
+            if body is not None:
+                self.log(f"Using cached response for {cache_url}")
+            else:
+                meta = {}
+        
+        if body is None:
+            headers = {'If-None-Match': meta['etag']} if meta.get('etag') else {}
+            response = self.session.get(url, params=params, headers=headers)
+            
+            if response.status_code == 304 and meta:
+                body = self._read_cached_body(body_path)
+                if body is not None:
+                    self.log(f"Response not modified, using cache: {cache_url}")
+                    self._write_cache_meta(meta_path, meta.get('etag'))
+                else:
+                    # The cached body is gone; fetch it again without validators
+                    response = self.session.get(url, params=params)
+            
+            if body is None:
+                if response.status_code == 404:
+                    return None
+                response.raise_for_status()
+                body = response.content
+                self._write_cache(body_path, meta_path, body, response.headers.get('ETag'))
+        
+        data = json_utils.loads(body)
+        self._responses[cache_url] = data
+        return data
+    
+    def _read_cached_body(self, body_path: Path) -> Optional[bytes]:
+        """Read a cached response body, or return None if it can no longer be read."""
+        try:
+            return body_path.read_bytes()
+        except OSError as e:
+            self.log(f"Could not read cached GitHub response: {e}")
+            return None
+    
+    def _write_cache(self, body_path: Path, meta_path: Path, body: bytes, etag: Optional[str]):
+        """Store a response body and its ETag; caching is best effort."""
+        # Per-thread temp file, so concurrent lookups of the same URL don't interleave writes
+        tmp_path = body_path.with_name(f"{body_path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp_path.write_bytes(body)
+            tmp_path.replace(body_path)
+        except OSError as e:
+            self.log(f"Could not cache GitHub response: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return
+        self._write_cache_meta(meta_path, etag)
+    
+    def _write_cache_meta(self, meta_path: Path, etag: Optional[str]):
+        """Record when a cached response was last fetched or validated."""
+        try:
+            json_utils.dump_to_file(meta_path, {'etag': etag, 'fetched_at': time.time()}, indent=False)
+        except OSError as e:
+            self.log(f"Could not cache GitHub response: {e}")
+    
     def get_releases(self, limit: int = 50, include_drafts: bool = False, 
                     include_prereleases: bool = False) -> List[Dict]:
         """
@@ -58,10 +172,9 @@ class GitHubReleaseClient:
             GitHubAPIError: If API request fails
         """
         try:
-            params = {'per_page': limit}
-            response = self.session.get(self.api_url, params=params)
-            response.raise_for_status()
-            releases = response.json()
+            releases = self._get_json(self.api_url, params={'per_page': limit})
+            if releases is None:
+                raise GitHubAPIError(f"Repository not found: {self.repo}")
             
             self.log(f"Fetched {len(releases)} releases from {self.repo}")
             
@@ -81,7 +194,7 @@ class GitHubReleaseClient:
             self.log(f"Returning {len(filtered_releases)} filtered releases")
             return filtered_releases
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             error_msg = f"Error fetching releases from {self.repo}: {e}"
             self.log(error_msg)
             raise GitHubAPIError(error_msg)
@@ -101,18 +214,16 @@ class GitHubReleaseClient:
         """
         try:
             url = f"{self.api_url.rstrip('/releases')}/releases/tags/{tag}"
-            response = self.session.get(url)
+            release = self._get_json(url)
             
-            if response.status_code == 404:
+            if release is None:
                 self.log(f"Release not found: {tag}")
                 return None
             
-            response.raise_for_status()
-            release = response.json()
             self.log(f"Found release: {tag}")
             return release
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             error_msg = f"Error fetching release {tag} from {self.repo}: {e}"
             self.log(error_msg)
             raise GitHubAPIError(error_msg)
@@ -224,8 +335,8 @@ class GitHubReleaseClient:
         try:
             response = self.session.get("https://api.github.com/rate_limit")
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return json_utils.loads(response.content)
+        except (requests.exceptions.RequestException, ValueError) as e:
             error_msg = f"Error fetching rate limit info: {e}"
             self.log(error_msg)
             raise GitHubAPIError(error_msg)
\ No newline at end of file
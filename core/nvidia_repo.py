@@ -0,0 +1,204 @@
+"""
+NVIDIA CUDA repository listing downloads, cached on disk for the search and align commands.
+"""
+
+import codecs
+import os
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils import json_utils
+from utils.path_utils import get_cache_path
+
+
+# Cached listings served without ETag/Last-Modified are trusted for 24 hours
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Listings are downloaded and decoded in chunks of this many bytes
+STREAM_CHUNK_SIZE = 64 * 1024
+
+REQUEST_TIMEOUT = 30
+
+# Keep-alive session shared by every listing fetch; transient mirror errors are retried
+# with backoff, and requests negotiates gzip and decompresses transparently. Once retries
+# run out the last response is returned, so callers still see its HTTP status.
+_HTTP = requests.Session()
+_HTTP.headers.update({'User-Agent': 'eks-nvidia-tools/1.0'})
+_HTTP.mount('https://', HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods={"GET"}, respect_retry_after_header=True,
+                      raise_on_status=False),
+))
+
+# Cached listings already downloaded or revalidated by this process
+_fresh_listings = set()
+
+
+def listing_cache_key(os_version: str, repo_path: str) -> str:
+    """Cache key for the listing of one OS version and architecture path (e.g. "sbsa")."""
+    return f"nvidia_{os_version}_{repo_path}"
+
+
+def iter_listing_chunks(
+    url: str,
+    cache_key: Optional[str] = None,
+    cache_ttl: int = CACHE_TTL_SECONDS,
+    log: Optional[Callable[[str], None]] = None
+) -> Iterator[str]:
+    """
+    Yield a repository listing as decoded text chunks.
+
+    With a cache_key, a cached copy is revalidated via ETag/Last-Modified and reused on
+    HTTP 304; copies served without either are reused for cache_ttl seconds. Without one,
+    the listing is always downloaded and nothing is cached.
+
+    Raises:
+        requests.HTTPError: If the server answers with an error status
+        requests.RequestException: If the listing cannot be downloaded
+    """
+    log = log or (lambda message: None)
+
+    if cache_key is None:
+        with _HTTP.get(url, timeout=REQUEST_TIMEOUT, stream=True) as response:
+            _check_status(response)
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                yield decoder.decode(chunk)
+            yield decoder.decode(b'', final=True)
+        return
+
+    html_path = Path(get_cache_path(f"{cache_key}.html"))
+    meta_path = Path(get_cache_path(f"{cache_key}.meta.json"))
+
+    if html_path in _fresh_listings and html_path.exists():
+        log(f"Using NVIDIA repo listing refreshed this run: {html_path}")
+        yield from _iter_cached_listing(html_path)
+        return
+
+    meta = {}
+    if html_path.exists() and meta_path.exists():
+        try:
+            meta = json_utils.loads(meta_path.read_bytes())
+        except (OSError, ValueError):
+            meta = {}
+
+    headers = {}
+    if meta.get('etag'):
+        headers['If-None-Match'] = meta['etag']
+    if meta.get('last_modified'):
+        headers['If-Modified-Since'] = meta['last_modified']
+
+    # Without validators, fall back to trusting the cached copy for the TTL
+    if meta and not headers and time.time() - meta.get('fetched_at', 0) < cache_ttl:
+        log(f"Using cached NVIDIA repo listing: {html_path}")
+        yield from _iter_cached_listing(html_path)
+        return
+
+    with _HTTP.get(url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True) as response:
+        if response.status_code == 304 and meta:
+            log(f"NVIDIA repo listing not modified, using cache: {html_path}")
+            _fresh_listings.add(html_path)
+            yield from _iter_cached_listing(html_path)
+            return
+        _check_status(response)
+        yield from _stream_and_cache_listing(response, html_path, meta_path, log)
+
+
+def iter_listing_lines(
+    url: str,
+    cache_key: Optional[str] = None,
+    cache_ttl: int = CACHE_TTL_SECONDS,
+    log: Optional[Callable[[str], None]] = None
+) -> Iterator[str]:
+    """Yield a repository listing line by line, without line endings; see iter_listing_chunks()."""
+    pending = ""
+    with closing(iter_listing_chunks(url, cache_key, cache_ttl, log)) as chunks:
+        for chunk in chunks:
+            lines = (pending + chunk).split('\n')
+            pending = lines.pop()
+            yield from lines
+    if pending:
+        yield pending
+
+
+def _check_status(response: requests.Response) -> None:
+    """Raise requests.HTTPError unless the listing itself was returned."""
+    if response.status_code != 200:
+        response.raise_for_status()
+        raise requests.HTTPError(f"Unexpected HTTP {response.status_code} for {response.url}",
+                                 response=response)
+
+
+def _iter_cached_listing(html_path: Path) -> Iterator[str]:
+    """Yield a cached repository listing in text chunks."""
+    with open(html_path, 'r', encoding='utf-8', errors='replace') as f:
+        while True:
+            chunk = f.read(STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+
+def _stream_and_cache_listing(response: requests.Response, html_path: Path, meta_path: Path,
+                              log: Callable[[str], None]) -> Iterator[str]:
+    """
+    Yield a downloaded listing in text chunks while writing the raw bytes to the cache.
+
+    Caching is best effort; the cache entry is only replaced once the whole listing has
+    arrived. If the caller stops early, the rest is still downloaded into the cache.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+    # Per-thread temp file, so concurrent fetches of the same listing don't interleave writes
+    tmp_path = html_path.with_name(f"{html_path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+    try:
+        cache_file = open(tmp_path, 'wb')
+    except OSError as e:
+        log(f"Could not cache NVIDIA repo listing: {e}")
+        cache_file = None
+
+    complete = False
+    try:
+        try:
+            for chunk in chunks:
+                if cache_file:
+                    cache_file.write(chunk)
+                yield decoder.decode(chunk)
+            yield decoder.decode(b'', final=True)
+            complete = True
+        except GeneratorExit:
+            # The caller found what it needed; finish the download into the cache without decoding
+            if cache_file:
+                try:
+                    for chunk in chunks:
+                        cache_file.write(chunk)
+                    complete = True
+                except requests.RequestException as e:
+                    log(f"Could not cache NVIDIA repo listing: {e}")
+            raise
+    finally:
+        if cache_file:
+            cache_file.close()
+            try:
+                if complete:
+                    os.replace(tmp_path, html_path)
+                    _fresh_listings.add(html_path)
+                    json_utils.dump_to_file(meta_path, {
+                        'etag': response.headers.get('ETag'),
+                        'last_modified': response.headers.get('Last-Modified'),
+                        'fetched_at': time.time(),
+                    }, indent=False)
+                else:
+                    tmp_path.unlink()
+            except OSError as e:
+                log(f"Could not cache NVIDIA repo listing: {e}")
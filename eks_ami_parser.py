@@ -50,6 +50,16 @@ class EKSAMIParserCLI:
                 print(f"Error: {e}")
             return None
     
+    def find_driver_for_release_version(self, release_version: str, ami_type_str: str = "AL2023_x86_64_NVIDIA") -> Optional[str]:
+        """Find the kmod-nvidia-latest-dkms version shipped in a specific EKS release version."""
+        try:
+            ami_type = AMIType(ami_type_str)
+            return self.resolver.get_driver_for_release_version(release_version, ami_type)
+        except (ValueError, AMIResolutionError) as e:
+            if self.verbose:
+                print(f"Error: {e}")
+            return None
+    
     def find_releases_by_driver_version(self, driver_version: str, fuzzy: bool = False, 
                                        k8s_version: Optional[str] = None, 
                                        ami_types: list = None,
@@ -9,16 +9,28 @@ It supports two strategies across x86_64 and ARM64 architectures:
 """
 
 import argparse
+import copy
 import json
 import os
+import re
 import requests
-import subprocess
 import sys
-from typing import Dict, List, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from core.nvidia_repo import iter_listing_chunks, listing_cache_key
 from eks_ami_parser import EKSAMIParserCLI as EKSAMIParser
 from models.driver_alignment import DriverAlignment
-from models.ami_types import Architecture
+from models.ami_types import Architecture, is_al2_supported_version
+from utils import json_utils
+
+if TYPE_CHECKING:
+    import boto3
 
 # Load environment variables from .env file
 def load_env_file(env_path=".env"):
@@ -34,42 +46,108 @@ def load_env_file(env_path=".env"):
 # Load .env file at module level
 load_env_file()
 
+# Values dropped from generated nodegroup configs
+_EMPTY_VALUES = (None, {}, [])
+
+# SSM parameter paths for the GPU AMI types recommended by this tool
+_SSM_AMI_PATHS = {
+    'AL2023_x86_64_NVIDIA': 'amazon-linux-2023/x86_64/nvidia',
+    'AL2023_ARM_64_NVIDIA': 'amazon-linux-2023/arm64/nvidia',
+}
+
+# Complete x.y.z driver version (anything shorter is treated as a fuzzy search)
+_VER3_RE = re.compile(r'^\d+\.\d+\.\d+')
+# Pulls the x.y.z portion out of strings like "570.148.08-1.amzn2023"
+_VER_EXTRACT_RE = re.compile(r'(\d+\.\d+\.\d+)')
+# Driver version extraction, most to least specific.
+# Matches: 570.124.06, 560.35.05-1.amzn2023, 550.127.08-1.el7, etc.
+_VER_PATTERNS = (
+    _VER_EXTRACT_RE,           # Basic x.y.z format
+    re.compile(r'(\d+\.\d+)'),  # x.y format (fallback)
+    re.compile(r'(\d+)'),       # x format (last resort)
+)
+
+
+@dataclass
+class FindResult:
+    """Outcome of an AMI search by driver version."""
+    status: str  # "ok", "ambiguous" or "none"
+    ami_version: Optional[str] = None
+    k8s_version: Optional[str] = None
+    ami_type: Optional[str] = None
+    driver_version: Optional[str] = None
+
+
+@lru_cache(maxsize=16)
+def _load_template(path: str, mtime_ns: int) -> Dict:
+    """Parse a nodegroup template, cached until the file changes on disk."""
+    with open(path, 'rb') as f:
+        return json_utils.loads(f.read())
+
 
 class EKSNodegroupManager:
-    def __init__(self, profile: str = "default", region: str = "eu-west-1"):
+    # Serializes read-modify-write of the latest AMI cache across concurrent managers
+    _latest_ami_lock = threading.Lock()
+    
+    def __init__(self, profile: str = "default", region: str = "eu-west-1", refresh_cache: bool = False):
         self.profile = profile
         self.region = region
+        # Skip today's cached latest AMI lookups and resolve them again
+        self.refresh_cache = refresh_cache
         # AL2 End-of-Life Information
         self.AL2_EOL_DATE = "2024-11-26"  # November 26, 2024
-        self.AL2_LAST_K8S_VERSION = "1.32"
+        # AWS session and clients are created on first use
+        self._session = None
+        self._eks = None
+        self._ssm = None
+        # Release parser shared by AMI lookups
+        self._parser = None
+        # Cluster name -> Kubernetes version (profile and region are fixed per manager)
+        self._cluster_versions: Dict[str, str] = {}
+    
+    @property
+    def session(self) -> "boto3.Session":
+        """Shared boto3 session for this profile and region."""
+        if self._session is None:
+            # Imported on first AWS call so template generation and --help skip loading boto3;
+            # botocore exceptions are likewise imported where they are caught
+            import boto3
+            self._session = boto3.Session(profile_name=self.profile, region_name=self.region)
+        return self._session
+    
+    @property
+    def eks(self):
+        """EKS client, created on first use."""
+        if self._eks is None:
+            from core.eks_client import AWS_CLIENT_CONFIG
+            self._eks = self.session.client("eks", config=AWS_CLIENT_CONFIG)
+        return self._eks
+    
+    @property
+    def ssm(self):
+        """SSM client, created on first use."""
+        if self._ssm is None:
+            from core.eks_client import AWS_CLIENT_CONFIG
+            self._ssm = self.session.client("ssm", config=AWS_CLIENT_CONFIG)
+        return self._ssm
     
     def get_cluster_k8s_version(self, cluster_name: str) -> str:
         """Get the current Kubernetes version of the running cluster."""
-        cmd = [
-            "aws", "eks", "describe-cluster",
-            "--name", cluster_name,
-            "--profile", self.profile,
-            "--region", self.region,
-            "--query", "cluster.version",
-            "--output", "text"
-        ]
+        k8s_version = self._cluster_versions.get(cluster_name)
+        if k8s_version is None:
+            from botocore.exceptions import BotoCoreError, ClientError
+            try:
+                k8s_version = self.eks.describe_cluster(name=cluster_name)["cluster"]["version"]
+            except (BotoCoreError, ClientError) as e:
+                raise Exception(f"Failed to get cluster version: {e}")
+            self._cluster_versions[cluster_name] = k8s_version
         
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            k8s_version = result.stdout.strip()
-            print(f"🔍 Detected cluster Kubernetes version: {k8s_version}")
-            return k8s_version
-        except subprocess.CalledProcessError as e:
-            raise Exception(f"Failed to get cluster version: {e.stderr}")
+        print(f"🔍 Detected cluster Kubernetes version: {k8s_version}")
+        return k8s_version
     
     def is_al2_supported(self, k8s_version: str) -> bool:
         """Check if AL2 AMIs are still supported for the given Kubernetes version."""
-        try:
-            version_parts = [int(x) for x in k8s_version.split('.')]
-            last_supported = [int(x) for x in self.AL2_LAST_K8S_VERSION.split('.')]
-            return version_parts <= last_supported
-        except (ValueError, IndexError):
-            return False
+        return is_al2_supported_version(k8s_version)
     
     def get_recommended_ami_type(self, k8s_version: str, architecture: str = "x86_64") -> str:
         """Get the recommended AMI type for a given Kubernetes version and architecture."""
@@ -84,27 +162,102 @@ class EKSNodegroupManager:
             return False
         return True
     
+    def _get_parser(self, verbose: bool = False) -> EKSAMIParser:
+        """Return the shared release parser, rebuilding it only if verbosity changes."""
+        if self._parser is None or self._parser.verbose != verbose:
+            self._parser = EKSAMIParser(verbose=verbose)
+        return self._parser
+    
+    def _latest_ami_cache_key(self, k8s_version: str, ami_type: str) -> str:
+        """Cache key for latest AMI lookups; AMI releases change rarely, so entries last one day.
+        
+        The SSM recommendation is read per region, so the region is part of the key.
+        """
+        return f"{self.region}|{k8s_version}|{ami_type}|{date.today().isoformat()}"
+    
+    def _load_latest_ami_cache(self) -> Dict[str, List[str]]:
+        """Load cached latest AMI lookups from disk."""
+        from utils.path_utils import get_cache_path
+        
+        try:
+            with open(get_cache_path("latest_ami.json"), 'rb') as f:
+                return json_utils.loads(f.read())
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_latest_ami(self, cache_key: str, ami_version: str, kmod_version: str):
+        """Persist a latest AMI lookup, dropping entries from previous days."""
+        from utils.path_utils import get_cache_path
+        
+        today = cache_key.rsplit('|', 1)[-1]
+        with self._latest_ami_lock:
+            cache = {k: v for k, v in self._load_latest_ami_cache().items() if k.endswith(f"|{today}")}
+            cache[cache_key] = [ami_version, kmod_version]
+            try:
+                json_utils.dump_to_file(get_cache_path("latest_ami.json"), cache)
+            except OSError:
+                pass
+    
+    def get_latest_ami_via_ssm(self, k8s_version: str, ami_type: str) -> Optional[str]:
+        """Get the recommended AMI release version (e.g. "1.32.3-20250519") from AWS SSM.
+        
+        Returns None when the parameter is unavailable so callers can fall back to release notes.
+        """
+        ami_path = _SSM_AMI_PATHS.get(ami_type)
+        if not ami_path:
+            return None
+        
+        from botocore.exceptions import BotoCoreError, ClientError
+        
+        parameter = f"/aws/service/eks/optimized-ami/{k8s_version}/{ami_path}/recommended/release_version"
+        try:
+            return self.ssm.get_parameter(Name=parameter)["Parameter"]["Value"]
+        except (BotoCoreError, ClientError):
+            return None
+    
     def get_latest_ami_for_k8s_version(self, k8s_version: str, architecture: str = "x86_64") -> Tuple[str, str]:
         """Get the latest AMI release version and driver version for a K8s version and architecture."""
-        eks_parser = EKSAMIParser(verbose=False)  # Control verbosity through main debug flag
+        eks_parser = self._get_parser(verbose=False)  # Control verbosity through main debug flag
         
         # Get recommended AMI type for architecture
         ami_type = self.get_recommended_ami_type(k8s_version, architecture)
-        result = eks_parser.find_latest_release_for_k8s(k8s_version, ami_type)
-        
-        if not result:
-            raise Exception(f"No {architecture} AMI found for Kubernetes version {k8s_version}")
         
-        release_tag, release_date, kmod_version = result
-        # Extract version from tag (e.g., "v20250403" -> "20250403")
-        ami_version = release_tag.lstrip('v')
+        cache_key = self._latest_ami_cache_key(k8s_version, ami_type)
+        cached = None if self.refresh_cache else self._load_latest_ami_cache().get(cache_key)
+        if cached:
+            ami_version, kmod_version = cached
+            return ami_version, kmod_version
+        
+        # SSM publishes the recommended release directly; only that release's notes are needed
+        release_version = self.get_latest_ami_via_ssm(k8s_version, ami_type)
+        kmod_version = None
+        if release_version:
+            kmod_version = eks_parser.find_driver_for_release_version(release_version, ami_type)
+        
+        if kmod_version:
+            # e.g., "1.32.3-20250519" -> "20250519"
+            ami_version = release_version.rsplit('-', 1)[-1]
+        else:
+            result = eks_parser.find_latest_release_for_k8s(k8s_version, ami_type)
+            
+            if not result:
+                raise Exception(f"No {architecture} AMI found for Kubernetes version {k8s_version}")
+            
+            release_tag, release_date, kmod_version = result
+            # Extract version from tag (e.g., "v20250403" -> "20250403")
+            ami_version = release_tag.lstrip('v')
         
+        self._save_latest_ami(cache_key, ami_version, kmod_version)
         return ami_version, kmod_version
     
     def find_ami_for_driver_version(self, driver_version: str, architecture: str = "x86_64", 
-                                   k8s_version: Optional[str] = None, debug: bool = False) -> Optional[Tuple[str, str, str, str]]:
-        """Find AMI release that contains the specified driver version for given architecture."""
-        eks_parser = EKSAMIParser(verbose=debug)  # Use debug flag to control verbosity
+                                   k8s_version: Optional[str] = None, debug: bool = False) -> FindResult:
+        """Find AMI release that contains the specified driver version for given architecture.
+        
+        Returns a FindResult whose status is "ambiguous" when a fuzzy search matched several
+        driver versions, and "none" when no compatible AMI was found.
+        """
+        eks_parser = self._get_parser(verbose=debug)  # Use debug flag to control verbosity
         
         # Smart AMI type selection based on architecture and K8s version
         if architecture.lower() == "arm64":
@@ -121,8 +274,7 @@ class EKSNodegroupManager:
                 print(f"🔍 Searching both AL2023 and AL2 AMI types for driver {driver_version}")
         
         # Determine if this is a fuzzy search (incomplete version)
-        import re
-        is_fuzzy_search = not re.match(r'^\d+\.\d+\.\d+', driver_version)
+        is_fuzzy_search = not _VER3_RE.match(driver_version)
         
         matches = eks_parser.find_releases_by_driver_version(
             driver_version, fuzzy=True, k8s_version=k8s_version, 
@@ -132,7 +284,7 @@ class EKSNodegroupManager:
         print(f"🔍 Found {len(matches) if matches else 0} matching {architecture} AMI releases")
         
         if not matches:
-            return None
+            return FindResult("none")
         
         # Always show the matches found
         print("📋 Compatible releases found:")
@@ -147,20 +299,23 @@ class EKSNodegroupManager:
             print(f"   Examples:")
             
             # Show examples of exact versions they could use
-            unique_versions = set()
-            for _, _, _, kmod_version, _ in matches[:3]:  # Show first 3 unique versions
+            unique_versions = {}  # Insertion-ordered set of the first 3 unique versions
+            for _, _, _, kmod_version, _ in matches:
                 # Extract just the version number (e.g., "570.148.08" from "570.148.08-1.amzn2023")
-                version_match = re.search(r'(\d+\.\d+\.\d+)', kmod_version)
+                version_match = _VER_EXTRACT_RE.search(kmod_version)
                 if version_match:
-                    unique_versions.add(version_match.group(1))
-                if len(unique_versions) >= 3:
-                    break
+                    unique_versions[version_match.group(1)] = None
+                    if len(unique_versions) == 3:
+                        break
             
-            for version in sorted(unique_versions):
-                print(f"     --current-driver-version {version} --architecture {architecture}")
+            if unique_versions:
+                print("\n".join(
+                    f"     --current-driver-version {version} --architecture {architecture}"
+                    for version in sorted(unique_versions)
+                ))
             
             print(f"\n💡 Tip: Use exact versions for production deployments to ensure consistency")
-            return None
+            return FindResult("ambiguous")
         
         # If exact search or only one match, proceed with selection
         # Prefer AL2023 matches if available
@@ -179,10 +334,10 @@ class EKSNodegroupManager:
             print(f"⚠️  WARNING: Found driver {driver_version} in {ami_type} for K8s {k8s_ver}")
             print(f"   But {ami_type} is not supported for Kubernetes {k8s_ver}")
             print(f"   Consider using a different driver version available in AL2023")
-            return None
+            return FindResult("none")
         
         ami_version = release_tag.lstrip('v')
-        return ami_version, k8s_ver, ami_type, kmod_version  # Return the actual driver version too
+        return FindResult("ok", ami_version, k8s_ver, ami_type, kmod_version)  # Return the actual driver version too
     
     def _get_default_nodegroup_template(self) -> Dict:
         """Return a default nodegroup template from file - no hardcoded fallback."""
@@ -192,8 +347,8 @@ class EKSNodegroupManager:
         
         if os.path.exists(default_template_path):
             try:
-                with open(default_template_path, 'r') as f:
-                    template = json.load(f)
+                with open(default_template_path, 'rb') as f:
+                    template = json_utils.loads(f.read())
                 print(f"📋 Using default template from: {default_template_path}")
                 return template
             except (FileNotFoundError, json.JSONDecodeError) as e:
@@ -204,16 +359,46 @@ class EKSNodegroupManager:
 
 
 class NVIDIADriverResolver:
+    # Repo listings are read in chunks; the overlap covers a .deb filename split across two chunks
+    SCAN_OVERLAP = 256
+    
+    DRIVER_PACKAGES = ('libnvidia-compute', 'libnvidia-encode', 'libnvidia-decode')
+    _DEB_RE = re.compile(
+        r'(?P<pkg>libnvidia-(?:compute|encode|decode))-(\d+)_(?P<ver>[\d.]+[-\w]*)_(?P<arch>amd64|arm64)\.deb'
+    )
+    
     def __init__(self, ubuntu_version: str = "ubuntu2204", architecture: str = "x86_64", debug: bool = False):
         self.ubuntu_version = ubuntu_version
         self.architecture = architecture
         self.debug = debug
+        # Background refresh of the repository index
+        self._prefetch = None
     
     def log(self, message: str):
         """Print debug messages if debug mode is enabled."""
         if self.debug:
             print(f"[DRIVER-DEBUG] {message}")
     
+    def get_repo_base_url(self) -> str:
+        """Get the NVIDIA CUDA repository URL for the Ubuntu version and architecture."""
+        return f"https://developer.download.nvidia.com/compute/cuda/repos/{self.ubuntu_version}/{self.get_nvidia_repo_path()}/"
+    
+    def prefetch_repo_listing(self):
+        """Start refreshing the cached repository index in the background.
+        
+        The listing does not depend on the driver version, so it can be fetched while
+        the AMI lookup is still running; find_deb_urls waits for it before scanning.
+        """
+        if self._prefetch is None:
+            executor = ThreadPoolExecutor(max_workers=1)
+            self._prefetch = executor.submit(self._refresh_repo_listing)
+            executor.shutdown(wait=False)
+    
+    def _refresh_repo_listing(self):
+        """Download or revalidate the cached repository index without scanning it."""
+        for _ in self._iter_repo_listing(self.get_repo_base_url(), self.get_nvidia_repo_path()):
+            pass
+    
     def get_nvidia_repo_path(self) -> str:
         """Get the appropriate NVIDIA repository path for the architecture."""
         if self.architecture.lower() == "arm64":
@@ -228,26 +413,28 @@ class NVIDIADriverResolver:
         else:
             return "amd64"
     
+    def _iter_repo_listing(self, base_url: str, repo_path: str) -> Iterator[str]:
+        """Yield the NVIDIA repository index as text chunks through the shared listing cache."""
+        try:
+            yield from iter_listing_chunks(
+                base_url, listing_cache_key(self.ubuntu_version, repo_path), log=self.log
+            )
+        except requests.HTTPError as e:
+            raise Exception(f"Failed to fetch NVIDIA repo page: {base_url} (HTTP {e.response.status_code})")
+        except requests.RequestException as e:
+            raise Exception(f"Failed to fetch NVIDIA repo page: {base_url} - {e}")
+    
     def find_deb_urls(self, driver_version_raw: str) -> Tuple[str, List[str]]:
         """Find NVIDIA .deb URLs and return formatted driver version for the target architecture."""
-        import re
         
         self.log(f"Processing driver version: '{driver_version_raw}' for {self.architecture}")
         
-        # More flexible regex to handle various formats
-        # Matches: 570.124.06, 560.35.05-1.amzn2023, 550.127.08-1.el7, etc.
-        version_patterns = [
-            r"(\d+\.\d+\.\d+)",  # Basic x.y.z format
-            r"(\d+\.\d+)",       # x.y format (fallback)
-            r"(\d+)"             # x format (last resort)
-        ]
-        
         version_base = None
-        for pattern in version_patterns:
-            match = re.search(pattern, driver_version_raw)
+        for pattern in _VER_PATTERNS:
+            match = pattern.search(driver_version_raw)
             if match:
                 version_base = match.group(1)
-                self.log(f"Extracted version: {version_base} using pattern {pattern}")
+                self.log(f"Extracted version: {version_base} using pattern {pattern.pattern}")
                 break
         
         if not version_base:
@@ -263,47 +450,58 @@ class NVIDIADriverResolver:
         repo_path = self.get_nvidia_repo_path()
         package_suffix = self.get_package_suffix()
 
-        base_url = f"https://developer.download.nvidia.com/compute/cuda/repos/{self.ubuntu_version}/{repo_path}/"
+        base_url = self.get_repo_base_url()
         self.log(f"Searching NVIDIA repository: {base_url}")
         
-        try:
-            res = requests.get(base_url)
-            if res.status_code != 200:
-                raise Exception(f"Failed to fetch NVIDIA repo page: {base_url} (HTTP {res.status_code})")
-        except requests.RequestException as e:
-            raise Exception(f"Failed to fetch NVIDIA repo page: {base_url} - {e}")
+        if self._prefetch is not None:
+            try:
+                self._prefetch.result()
+            except Exception as e:
+                self.log(f"Background refresh of NVIDIA repo listing failed, fetching directly: {e}")
+            self._prefetch = None
+        
+        partial_version = f"{version_parts[0]}.{version_parts[1]}" if len(version_parts) >= 2 else None
+        
+        # Single streamed pass over the listing, keeping the first exact and partial hit per
+        # package. A short tail is carried between chunks so filenames split across a chunk
+        # boundary still match; scanning stops once every package has an exact match.
+        exact_matches = {}
+        partial_matches = {}
+        tail = ""
+        with closing(self._iter_repo_listing(base_url, repo_path)) as listing:
+            for chunk in listing:
+                window = tail + chunk
+                for m in self._DEB_RE.finditer(window):
+                    if m.group('arch') != package_suffix:
+                        continue
+                    pkg, ver = m.group('pkg'), m.group('ver')
+                    if ver.startswith(version_base):
+                        exact_matches.setdefault(pkg, m)
+                    elif partial_version and ver.startswith(partial_version):
+                        partial_matches.setdefault(pkg, m)
+                if len(exact_matches) == len(self.DRIVER_PACKAGES):
+                    break
+                tail = window[-self.SCAN_OVERLAP:]
         
         deb_urls = []
         found_version_suffix = None
 
-        for pkg in ['libnvidia-compute', 'libnvidia-encode', 'libnvidia-decode']:
-            # Try exact match first
-            regex_exact = re.compile(rf'{pkg}-(\d+)_({re.escape(version_base)}[-\w]*)_{package_suffix}\.deb')
-            match = regex_exact.search(res.text)
+        for pkg in self.DRIVER_PACKAGES:
+            # Prefer an exact match; fall back to a partial one (useful for version_base
+            # like "570.124" when actual is "570.124.06")
+            match = exact_matches.get(pkg)
+            kind = "exact"
+            if not match:
+                match = partial_matches.get(pkg)
+                kind = "partial"
             
             if match:
-                version_suffix = match.group(2)
+                found_version_suffix = match.group('ver')
                 deb_urls.append(base_url + match.group(0))
-                found_version_suffix = version_suffix
-                self.log(f"Found exact match for {pkg}: {match.group(0)}")
+                self.log(f"Found {kind} match for {pkg}: {match.group(0)}")
             else:
-                # Try partial match (useful for version_base like "570.124" when actual is "570.124.06")
-                if len(version_parts) >= 2:
-                    partial_version = f"{version_parts[0]}.{version_parts[1]}"
-                    regex_partial = re.compile(rf'{pkg}-(\d+)_({re.escape(partial_version)}[\d.-]*[-\w]*)_{package_suffix}\.deb')
-                    match_partial = regex_partial.search(res.text)
-                    
-                    if match_partial:
-                        version_suffix = match_partial.group(2)
-                        deb_urls.append(base_url + match_partial.group(0))
-                        found_version_suffix = version_suffix
-                        self.log(f"Found partial match for {pkg}: {match_partial.group(0)}")
-                    else:
-                        deb_urls.append(f"# NOT FOUND: {pkg}-{major}_{version_base}_{package_suffix}.deb")
-                        self.log(f"No match found for {pkg}")
-                else:
-                    deb_urls.append(f"# NOT FOUND: {pkg}-{major}_{version_base}_{package_suffix}.deb")
-                    self.log(f"No match found for {pkg}")
+                deb_urls.append(f"# NOT FOUND: {pkg}-{major}_{version_base}_{package_suffix}.deb")
+                self.log(f"No match found for {pkg}")
 
         if not found_version_suffix:
             print(f"⚠️  Warning: Could not find any matching .deb files for version {version_base} on {self.architecture}")
@@ -331,17 +529,23 @@ class DriverAlignmentOrchestrator:
         self.debug = config.get('debug', False)
         self.nodegroup_manager = EKSNodegroupManager(
             profile=config.get('aws_profile', 'default'),
-            region=config.get('aws_region', 'eu-west-1')
+            region=config.get('aws_region', 'eu-west-1'),
+            refresh_cache=config.get('refresh_cache', False)
         )
         self.driver_resolver = NVIDIADriverResolver(
             ubuntu_version=config.get('ubuntu_version', 'ubuntu2204'),
             architecture=config.get('architecture', 'x86_64'),
             debug=self.debug
         )
+        # Default template is loaded from disk on first use and copied per config
+        self._default_template = None
     
     def align_drivers_ami_first(self, k8s_version: str, architecture: str = "x86_64", cluster_name: str = None) -> DriverAlignment:
         """Strategy 1: Use latest AMI, update container drivers to match."""
         
+        # Fetch the NVIDIA package index while the cluster and AMI lookups run
+        self.driver_resolver.prefetch_repo_listing()
+        
         # Auto-detect K8s version if not provided
         if not k8s_version and cluster_name:
             k8s_version = self.nodegroup_manager.get_cluster_k8s_version(cluster_name)
@@ -387,6 +591,9 @@ class DriverAlignmentOrchestrator:
                                      k8s_version: Optional[str] = None, cluster_name: str = None) -> DriverAlignment:
         """Strategy 2: Use existing container drivers, find compatible AMI."""
         
+        # Fetch the NVIDIA package index while the cluster and AMI lookups run
+        self.driver_resolver.prefetch_repo_listing()
+        
         # Auto-detect K8s version if not provided
         if not k8s_version and cluster_name:
             k8s_version = self.nodegroup_manager.get_cluster_k8s_version(cluster_name)
@@ -399,8 +606,7 @@ class DriverAlignmentOrchestrator:
         print(f"🔄 Finding {arch_display} AMI compatible with driver version {current_driver_version}...")
         
         # Validate driver version format before searching
-        import re
-        if not re.match(r'\d+\.\d+\.\d+', current_driver_version):
+        if not _VER3_RE.match(current_driver_version):
             print(f"⚠️  Warning: Driver version '{current_driver_version}' doesn't match expected format (e.g., '570.124.06')")
             print(f"   This may cause issues finding compatible container packages")
         
@@ -408,13 +614,12 @@ class DriverAlignmentOrchestrator:
             current_driver_version, architecture, k8s_version, debug=self.debug
         )
         
-        if not result:
-            # Check if this was a fuzzy search that was stopped
-            if not re.match(r'^\d+\.\d+\.\d+', current_driver_version):
-                # This was likely a fuzzy search that found multiple results
-                print(f"\n💡 Please run the command again with an exact driver version from the list above.")
-                return None
-            
+        if result.status == "ambiguous":
+            # A fuzzy search found multiple driver versions
+            print(f"\n💡 Please run the command again with an exact driver version from the list above.")
+            return None
+        
+        if result.status == "none":
             # Provide helpful guidance for migration
             print(f"\n❌ No compatible {arch_display} AMI found for driver version {current_driver_version}")
             
@@ -438,7 +643,10 @@ class DriverAlignmentOrchestrator:
             
             raise Exception(f"No compatible {arch_display} AMI found for driver version {current_driver_version}")
         
-        ami_version, found_k8s_version, ami_type, actual_driver_version = result
+        ami_version = result.ami_version
+        found_k8s_version = result.k8s_version
+        ami_type = result.ami_type
+        actual_driver_version = result.driver_version
         
         print(f"📦 Compatible {arch_display} AMI: v{ami_version}")
         print(f"🔧 Kubernetes version: {found_k8s_version}")
@@ -524,11 +732,15 @@ class DriverAlignmentOrchestrator:
                 overrides=nodegroup_overrides
             )
             
+            # Serialize once for both the console preview and the file
+            config_bytes = json_utils.dumps(final_config, indent=True)
+            config_json = config_bytes.decode('utf-8')
+            
             # Output to console
             print("\n" + "="*80)
             print(f"📋 GENERATED {arch_display} NODEGROUP CONFIGURATION:")
             print("="*80)
-            print(json.dumps(final_config, indent=2))
+            print(config_json)
             print("="*80)
             
             # Output to file
@@ -536,12 +748,11 @@ class DriverAlignmentOrchestrator:
             from utils.path_utils import get_output_path
             output_filename = output_file or get_output_path(f"nodegroup-{nodegroup_name}{arch_suffix}-config.json")
             try:
-                with open(output_filename, 'w') as f:
-                    json.dump(final_config, f, indent=2)
+                Path(output_filename).write_bytes(config_bytes)
                 print(f"✅ Configuration saved to: {output_filename}")
                 results["config_file"] = output_filename
                 results["nodegroup_config"] = final_config
-            except Exception as e:
+            except OSError as e:
                 print(f"❌ Error saving configuration file: {e}")
                 results["error"] = str(e)
             
@@ -566,11 +777,15 @@ class DriverAlignmentOrchestrator:
                 overrides=nodegroup_overrides
             )
             
+            # Serialize once for both the console preview and the file
+            config_bytes = json_utils.dumps(final_config, indent=True)
+            config_json = config_bytes.decode('utf-8')
+            
             # Output to console
             print("\n" + "="*80)
             print(f"📋 GENERATED {arch_display} NODEGROUP CONFIGURATION:")
             print("="*80)
-            print(json.dumps(final_config, indent=2))
+            print(config_json)
             print("="*80)
             
             # Output to file
@@ -578,22 +793,19 @@ class DriverAlignmentOrchestrator:
             from utils.path_utils import get_output_path
             output_filename = output_file or get_output_path(f"nodegroup-{nodegroup_name}{arch_suffix}-config.json")
             try:
-                with open(output_filename, 'w') as f:
-                    json.dump(final_config, f, indent=2)
+                Path(output_filename).write_bytes(config_bytes)
                 print(f"✅ Configuration saved to: {output_filename}")
                 results["config_file"] = output_filename
                 results["nodegroup_config"] = final_config
-            except Exception as e:
+            except OSError as e:
                 print(f"❌ Error saving configuration file: {e}")
                 results["error"] = str(e)
             
             print(f"\n🔧 Container Driver Information ({arch_display}):")
             print(f"   • Update your {alignment.architecture.value} containers to use driver version: {alignment.formatted_driver_version}")
             print(f"   • NVIDIA driver packages to install in {alignment.architecture.value} containers:")
-            for url in alignment.deb_urls:
-                if not url.startswith("# NOT FOUND"):
-                    package_name = url.split('/')[-1].split('_')[0]
-                    print(f"     - {package_name}: {url}")
+            for package_name, url in alignment.deb_packages:
+                print(f"     - {package_name}: {url}")
             
             if alignment.architecture.value == "arm64":
                 print(f"\n🏗️  ARM64 Container Build Notes:")
@@ -619,15 +831,17 @@ class DriverAlignmentOrchestrator:
         # Load template
         if template_path:
             try:
-                with open(template_path, 'r') as f:
-                    config = json.load(f)
+                # Deep copy so overrides (e.g. merged labels) never reach the cached template
+                config = copy.deepcopy(_load_template(template_path, os.stat(template_path).st_mtime_ns))
             except FileNotFoundError:
                 raise Exception(f"Template file not found: {template_path}")
             except json.JSONDecodeError as e:
                 raise Exception(f"Invalid JSON in template file: {e}")
         else:
             # Use default template
-            config = self.nodegroup_manager._get_default_nodegroup_template()
+            if self._default_template is None:
+                self._default_template = self.nodegroup_manager._get_default_nodegroup_template()
+            config = copy.deepcopy(self._default_template)
         
         # Apply overrides
         if overrides:
@@ -639,68 +853,75 @@ class DriverAlignmentOrchestrator:
                 else:
                     config[key] = value
         
-        # Convert to AWS CLI format (using the keys expected by create-nodegroup)
-        aws_config = {
-            "clusterName": config["clusterName"],
-            "nodegroupName": config["nodegroupName"],
-            "scalingConfig": config.get("scalingConfig", {}),
-            "instanceTypes": config.get("instanceTypes", []),
-            "amiType": config.get("amiType"),
-            "nodeRole": config["nodeRole"],
-            "subnets": config["subnets"],
-            "version": config.get("version"),
-            "releaseVersion": config.get("releaseVersion"),
-            "capacityType": config.get("capacityType"),
-            "diskSize": config.get("diskSize"),
-            "updateConfig": config.get("updateConfig", {}),
-            "labels": config.get("labels", {}),
-            "taints": config.get("taints", []),
-            "remoteAccess": config.get("remoteAccess", {})
-        }
-        
-        # Remove empty/None values
-        aws_config = {k: v for k, v in aws_config.items() if v is not None and v != {} and v != []}
+        # Convert to AWS CLI format (using the keys expected by create-nodegroup),
+        # skipping empty/None values
+        aws_config = {}
+        for key, value in (
+            ("clusterName", config["clusterName"]),
+            ("nodegroupName", config["nodegroupName"]),
+            ("scalingConfig", config.get("scalingConfig")),
+            ("instanceTypes", config.get("instanceTypes")),
+            ("amiType", config.get("amiType")),
+            ("nodeRole", config["nodeRole"]),
+            ("subnets", config["subnets"]),
+            ("version", config.get("version")),
+            ("releaseVersion", config.get("releaseVersion")),
+            ("capacityType", config.get("capacityType")),
+            ("diskSize", config.get("diskSize")),
+            ("updateConfig", config.get("updateConfig")),
+            ("labels", config.get("labels")),
+            ("taints", config.get("taints")),
+            ("remoteAccess", config.get("remoteAccess")),
+        ):
+            if value not in _EMPTY_VALUES:
+                aws_config[key] = value
         
         return aws_config
     
     def print_alignment_summary(self, alignment: DriverAlignment):
         """Print a summary of the alignment plan."""
         arch_display = alignment.architecture_display
-        print("\n" + "="*80)
-        print(f"DRIVER ALIGNMENT SUMMARY ({alignment.strategy.upper()}) - {arch_display}")
-        print("="*80)
-        print(f"Strategy: {alignment.strategy}")
-        print(f"Architecture: {arch_display}")
-        print(f"Kubernetes Version: {alignment.k8s_version}")
-        print(f"AMI Release Version: {alignment.ami_release_version}")
-        print(f"AMI Driver Version: {alignment.ami_driver_version}")
-        print(f"Container Driver Version: {alignment.container_driver_version}")
-        print(f"Formatted Driver Version: {alignment.formatted_driver_version}")
+        arch = alignment.architecture.value
+        # Built up front and written once instead of one print() per line
+        lines = [
+            "",
+            "=" * 80,
+            f"DRIVER ALIGNMENT SUMMARY ({alignment.strategy.upper()}) - {arch_display}",
+            "=" * 80,
+            f"Strategy: {alignment.strategy}",
+            f"Architecture: {arch_display}",
+            f"Kubernetes Version: {alignment.k8s_version}",
+            f"AMI Release Version: {alignment.ami_release_version}",
+            f"AMI Driver Version: {alignment.ami_driver_version}",
+            f"Container Driver Version: {alignment.container_driver_version}",
+            f"Formatted Driver Version: {alignment.formatted_driver_version}",
+        ]
         
         if alignment.strategy == "ami-first":
-            print(f"\n🔧 Container Updates Required ({arch_display}):")
-            print(f"   • Update {alignment.architecture.value} container images to use driver: {alignment.formatted_driver_version}")
-            print(f"   • Use these NVIDIA .deb packages in your Dockerfile:")
-            for url in alignment.deb_urls:
-                if not url.startswith("# NOT FOUND"):
-                    package_name = url.split('/')[-1].split('_')[0]
-                    print(f"     - {package_name}")
+            lines.append(f"\n🔧 Container Updates Required ({arch_display}):")
+            lines.append(f"   • Update {arch} container images to use driver: {alignment.formatted_driver_version}")
+            lines.append(f"   • Use these NVIDIA .deb packages in your Dockerfile:")
+            lines.extend(f"     - {package_name}" for package_name, _ in alignment.deb_packages)
             
-            if alignment.architecture.value == "arm64":
-                print(f"   • Remember to use ARM64-compatible base images and package URLs")
+            if arch == "arm64":
+                lines.append(f"   • Remember to use ARM64-compatible base images and package URLs")
             
-            print(f"\n📦 Nodegroup Configuration:")
-            print(f"   • Will be generated using latest {arch_display} AMI with driver {alignment.ami_driver_version}")
-            print(f"   • AMI Type: {alignment.nodegroup_config['ami_type']}")
+            lines.append(f"\n📦 Nodegroup Configuration:")
+            lines.append(f"   • Will be generated using latest {arch_display} AMI with driver {alignment.ami_driver_version}")
+            lines.append(f"   • AMI Type: {alignment.nodegroup_config['ami_type']}")
         else:
-            print(f"\nPurpose: Generate {arch_display} nodegroup configuration for existing container images")
-            print(f"AMI Type: {alignment.nodegroup_config['ami_type']}")
-            print(f"Container compatibility: Your {alignment.architecture.value} containers should work with this AMI")
+            lines.append(f"\nPurpose: Generate {arch_display} nodegroup configuration for existing container images")
+            lines.append(f"AMI Type: {alignment.nodegroup_config['ami_type']}")
+            lines.append(f"Container compatibility: Your {arch} containers should work with this AMI")
         
-        print("="*80)
+        lines.append("=" * 80)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 
-def main():
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser once per process."""
     parser = argparse.ArgumentParser(description="EKS NVIDIA Driver Alignment Tool with ARM64 Support")
     
     # Required arguments - only these are truly required (except during template generation)
@@ -754,9 +975,16 @@ def main():
                        help="Output file for nodegroup configuration")
     parser.add_argument("--generate-template", action="store_true",
                        help="Generate a sample nodegroup template file and exit")
+    parser.add_argument("--refresh-cache", action="store_true",
+                       help="Ignore today's cached latest AMI lookup and resolve it again")
     parser.add_argument("--debug", action="store_true", 
                        help="Enable detailed debug logging for driver resolution")
     
+    return parser
+
+
+def main():
+    parser = _build_parser()
     args = parser.parse_args()
     
     # Normalize architecture argument
@@ -836,8 +1064,7 @@ def main():
         }
         
         try:
-            with open(template_filename, 'w') as f:
-                json.dump(sample_template, f, indent=2)
+            json_utils.dump_to_file(template_filename, sample_template)
             
             arch_display = args.architecture.upper() if args.architecture == "arm64" else "x86_64"
             print(f"✅ Generated {arch_display} template: {template_filename}")
@@ -908,6 +1135,7 @@ def main():
         'ubuntu_version': args.ubuntu_version,
         'architecture': args.architecture,
         'debug': args.debug,
+        'refresh_cache': args.refresh_cache,
     }
     
     # Build template overrides from command line arguments
@@ -948,6 +1176,7 @@ def main():
     }
     
     # Check if we need to validate required parameters
+    from utils.path_utils import find_template_file
     template_will_provide = False
     if args.template and os.path.exists(args.template):
         template_will_provide = True
@@ -970,14 +1199,16 @@ def main():
                 missing_required.append(cli_arg)
         
         if missing_required:
-            print(f"❌ Error: No template file found and missing required arguments:")
-            for field in missing_required:
-                print(f"   {field}")
-            print(f"\n💡 Either:")
-            print(f"   1. Generate a template: python {os.path.basename(__file__)} --generate-template --architecture {args.architecture}")
-            print(f"   2. Create a nodegroup template file with required configuration")
-            print(f"   3. Provide a template file with --template")
-            print(f"   4. Specify all required arguments above")
+            missing_lines = "\n".join(f"   {field}" for field in missing_required)
+            sys.stderr.write(
+                f"❌ Error: No template file found and missing required arguments:\n"
+                f"{missing_lines}\n"
+                f"\n💡 Either:\n"
+                f"   1. Generate a template: python {os.path.basename(__file__)} --generate-template --architecture {args.architecture}\n"
+                f"   2. Create a nodegroup template file with required configuration\n"
+                f"   3. Provide a template file with --template\n"
+                f"   4. Specify all required arguments above\n"
+            )
             sys.exit(1)
     
     # Initialize orchestrator
@@ -5,40 +5,203 @@ This command provides driver alignment functionality using the refactored models
 """
 
 import argparse
+import copy
 import os
 import sys
-from typing import Optional, Dict, Any, List
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
 
 # Import the existing alignment classes
-from eks_nvidia_alignment import DriverAlignmentOrchestrator
 from models.driver_alignment import DriverAlignment
-from core.eks_client import EKSClient, EKSClientError, NodegroupInfo
-from core.ami_resolver import EKSAMIResolver
-from models.ami_types import AMIType, AMITypeManager
 
 from ..shared.arguments import (
     add_architecture_args, add_kubernetes_args, add_output_args, 
     add_aws_args, add_cluster_args
 )
 from utils.path_utils import get_template_path, get_output_path, find_template_file
-from ..shared.output import OutputFormatter
+from utils.naming_utils import strip_nodegroup_suffix
+from utils import json_utils
+from ..shared.output import OutputFormatter, ThreadOutputCapture
 from ..shared.validation import (
     validate_k8s_version, validate_architecture, validate_cluster_name,
     validate_driver_version, validate_aws_region, validate_aws_profile, ValidationError
 )
 from ..shared.progress import progress, print_step, print_separator
 
+if TYPE_CHECKING:
+    # The orchestrator and EKS client pull in the AWS/HTTP stack; they are imported when actually used
+    from eks_nvidia_alignment import DriverAlignmentOrchestrator
+    from core.eks_client import EKSClient, NodegroupInfo
+
+
+# Display names and default nodegroup name suffixes per architecture
+_ARCH_DISPLAY = {"arm64": "ARM64", "amd64": "x86_64", "x86_64": "x86_64"}
+_ARCH_SUFFIX = {"arm64": "-arm64"}
+
+_STRATEGY_CHOICES = ('ami-first', 'container-first')
+_CAPACITY_CHOICES = ('ON_DEMAND', 'SPOT')
+
+# Generated template defaults per architecture: (instance types, AMI type, kubernetes.io/arch label)
+_TEMPLATE_ARCH_DEFAULTS = {
+    "arm64": (("g5g.xlarge",), "AL2023_ARM_64_NVIDIA", "arm64"),
+    "x86_64": (("g4dn.xlarge",), "AL2023_x86_64_NVIDIA", "amd64"),
+}
+
+# Upper bound on nodegroups aligned concurrently in extraction mode
+_MAX_EXTRACTION_WORKERS = 16
+
+# Fields of a saved create-nodegroup config as (key, default), in output order;
+# releaseVersion is always replaced with the resolved AMI release version
+_SAVED_CONFIG_FIELDS = (
+    ("clusterName", None),
+    ("nodegroupName", None),
+    ("scalingConfig", {}),
+    ("instanceTypes", []),
+    ("amiType", None),
+    ("releaseVersion", None),
+    ("nodeRole", None),
+    ("subnets", []),
+    ("capacityType", "ON_DEMAND"),
+    ("diskSize", 50),
+    ("labels", {}),
+    ("taints", []),
+    ("tags", {}),
+)
+
+# Template overrides as (argument attribute, template key); scaling keys go under scalingConfig
+_OVERRIDE_MAP = (
+    ('nodegroup_name', 'nodegroupName'),
+    ('instance_types', 'instanceTypes'),
+    ('subnet_ids', 'subnets'),
+    ('node_role_arn', 'nodeRole'),
+    ('capacity_type', 'capacityType'),
+    ('disk_size', 'diskSize'),
+)
+_SCALING_MAP = (
+    ('min_size', 'minSize'),
+    ('max_size', 'maxSize'),
+    ('desired_size', 'desiredSize'),
+)
+_OVERRIDE_ATTRS = tuple(attr for attr, _ in _OVERRIDE_MAP + _SCALING_MAP)
+
+# Align-specific arguments per option group, as (flags, add_argument kwargs)
+_STRATEGY_ARGS = (
+    (('--strategy',), {
+        'choices': _STRATEGY_CHOICES,
+        'required': True,
+        'help': 'Alignment strategy: ami-first (use latest AMI) or container-first (find compatible AMI)',
+    }),
+)
+_TARGET_ARGS = (
+    (('--extract-from-cluster',), {
+        'help': 'Extract nodegroup configurations from existing cluster and apply strategy to each',
+    }),
+)
+_CONTAINER_FIRST_ARGS = (
+    (('--current-driver-version',), {
+        'help': 'Current container driver version (required for container-first strategy)',
+    }),
+)
+_EXTRACTION_ARGS = (
+    (('--extract-nodegroups',), {
+        'nargs': '+',
+        'help': 'Specific nodegroup names to extract (defaults to all GPU nodegroups)',
+    }),
+    (('--target-cluster',), {
+        'help': 'Target cluster name for generated nodegroup configurations (defaults to source cluster)',
+    }),
+    (('--new-nodegroup-suffix',), {
+        'default': None,
+        'help': 'Suffix to add to generated nodegroup names (default: random 4-char hex, e.g., -a3f7)',
+    }),
+)
+_NODEGROUP_ARGS = (
+    (('--nodegroup-name',), {'help': 'EKS nodegroup name (overrides template)'}),
+    (('--template',), {
+        'help': 'Path to nodegroup template JSON file (default: templates/nodegroup_template.json)',
+    }),
+)
+_OVERRIDE_ARGS = (
+    (('--instance-types',), {'nargs': '+', 'help': 'EC2 instance types for nodegroup (overrides template)'}),
+    (('--subnet-ids',), {'nargs': '+', 'help': 'Subnet IDs for nodegroup (overrides template)'}),
+    (('--node-role-arn',), {'help': 'IAM role ARN for nodegroup (overrides template)'}),
+    (('--capacity-type',), {'choices': _CAPACITY_CHOICES, 'help': 'Capacity type (overrides template)'}),
+    (('--disk-size',), {'type': int, 'help': 'Disk size in GB (overrides template)'}),
+    (('--min-size',), {'type': int, 'help': 'Minimum number of nodes (overrides template)'}),
+    (('--max-size',), {'type': int, 'help': 'Maximum number of nodes (overrides template)'}),
+    (('--desired-size',), {'type': int, 'help': 'Desired number of nodes (overrides template)'}),
+)
+_AWS_ARGS = (
+    (('--ubuntu-version',), {
+        'default': 'ubuntu2204',
+        'help': 'Ubuntu version for driver resolution (default: ubuntu2204)',
+    }),
+)
+_EXECUTION_ARGS = (
+    (('--plan-only',), {'action': 'store_true', 'help': 'Only show the alignment plan without executing'}),
+    (('--output-file', '-o'), {'help': 'Output file for nodegroup configuration'}),
+    (('--generate-template',), {
+        'action': 'store_true',
+        'help': 'Generate a sample nodegroup template file and exit',
+    }),
+    (('--refresh-cache',), {
+        'action': 'store_true',
+        'help': "Ignore today's cached latest AMI lookup and resolve it again",
+    }),
+)
+
+
+def _add_argument_specs(group, specs) -> None:
+    """Add (flags, kwargs) argument specs to a parser or argument group."""
+    for flags, kwargs in specs:
+        group.add_argument(*flags, **kwargs)
+
+
+def _run_validators(checks, formatter: OutputFormatter) -> bool:
+    """Run (validator, value) checks in order; report the first failure and return False."""
+    try:
+        for validator, value in checks:
+            validator(value)
+    except ValidationError as e:
+        formatter.print_status(str(e), 'error')
+        return False
+    return True
+
+
+@lru_cache(maxsize=8)
+def _path_exists(path: Optional[str]) -> bool:
+    """Check whether an input path exists, remembering the answer for the rest of the run."""
+    return bool(path) and os.path.exists(path)
+
+
+class AlignmentError(Exception):
+    """Exception raised when an alignment strategy cannot produce a plan."""
+    pass
+
 
 class AlignCommand:
     """Driver alignment subcommands using the refactored models."""
     
+    def __init__(self):
+        self._parser: Optional[argparse.ArgumentParser] = None
+        self._populated = False
+    
     def register_parser(self, subparsers) -> None:
-        """Register the align subcommand parser."""
+        """
+        Register the align subcommand parser.
+        
+        Only the subcommand itself is registered here; its options are added by
+        populate_parser() once the CLI knows the align parser will be used.
+        """
         parser = subparsers.add_parser(
             'align',
             help='Align NVIDIA drivers between EKS AMIs and container images',
             description='Align NVIDIA drivers between EKS nodegroup AMIs and container images using ami-first or container-first strategies. Use --extract-from-cluster to apply strategies to existing nodegroups.',
             formatter_class=argparse.RawDescriptionHelpFormatter,
+            allow_abbrev=False,
             epilog="""
 Examples:
   # AMI-first strategy: use latest AMI, update container drivers
@@ -72,134 +235,43 @@ Examples:
   eks-nvidia-tools align --strategy ami-first --k8s-version 1.32 --architecture arm64
 """
         )
+        parser.set_defaults(func=self.execute)
+        # A freshly registered parser has no options yet, even if an earlier one was populated
+        self._parser = parser
+        self._populated = False
+    
+    def populate_parser(self) -> None:
+        """Add the align options to the registered parser, once."""
+        if self._parser is None or self._populated:
+            return
+        self._populated = True
+        parser = self._parser
         
-        # Strategy selection
         strategy_group = parser.add_argument_group('Strategy Options')
-        strategy_group.add_argument(
-            '--strategy',
-            choices=['ami-first', 'container-first'],
-            required=True,
-            help='Alignment strategy: ami-first (use latest AMI) or container-first (find compatible AMI)'
-        )
+        _add_argument_specs(strategy_group, _STRATEGY_ARGS)
         
         # Cluster and version options
         target_group = parser.add_argument_group('Target Options')
         add_cluster_args(target_group)
         add_kubernetes_args(target_group)
         add_architecture_args(target_group)
-        target_group.add_argument(
-            '--extract-from-cluster',
-            help='Extract nodegroup configurations from existing cluster and apply strategy to each'
-        )
-        
-        # Container-first specific options
-        container_group = parser.add_argument_group('Container-First Options')
-        container_group.add_argument(
-            '--current-driver-version',
-            help='Current container driver version (required for container-first strategy)'
-        )
+        _add_argument_specs(target_group, _TARGET_ARGS)
         
-        # Extraction mode options
-        extract_group = parser.add_argument_group('Extraction Mode Options')
-        extract_group.add_argument(
-            '--extract-nodegroups',
-            nargs='+',
-            help='Specific nodegroup names to extract (defaults to all GPU nodegroups)'
-        )
-        extract_group.add_argument(
-            '--target-cluster',
-            help='Target cluster name for generated nodegroup configurations (defaults to source cluster)'
-        )
-        extract_group.add_argument(
-            '--new-nodegroup-suffix',
-            default=None,
-            help='Suffix to add to generated nodegroup names (default: random 4-char hex, e.g., -a3f7)'
-        )
-        
-        # Nodegroup configuration
-        nodegroup_group = parser.add_argument_group('Nodegroup Configuration')
-        nodegroup_group.add_argument(
-            '--nodegroup-name',
-            help='EKS nodegroup name (overrides template)'
-        )
-        nodegroup_group.add_argument(
-            '--template',
-            help='Path to nodegroup template JSON file (default: templates/nodegroup_template.json)'
-        )
-        
-        # Template overrides
-        override_group = parser.add_argument_group('Template Overrides')
-        override_group.add_argument(
-            '--instance-types',
-            nargs='+',
-            help='EC2 instance types for nodegroup (overrides template)'
-        )
-        override_group.add_argument(
-            '--subnet-ids',
-            nargs='+',
-            help='Subnet IDs for nodegroup (overrides template)'
-        )
-        override_group.add_argument(
-            '--node-role-arn',
-            help='IAM role ARN for nodegroup (overrides template)'
-        )
-        override_group.add_argument(
-            '--capacity-type',
-            choices=['ON_DEMAND', 'SPOT'],
-            help='Capacity type (overrides template)'
-        )
-        override_group.add_argument(
-            '--disk-size',
-            type=int,
-            help='Disk size in GB (overrides template)'
-        )
-        override_group.add_argument(
-            '--min-size',
-            type=int,
-            help='Minimum number of nodes (overrides template)'
-        )
-        override_group.add_argument(
-            '--max-size',
-            type=int,
-            help='Maximum number of nodes (overrides template)'
-        )
-        override_group.add_argument(
-            '--desired-size',
-            type=int,
-            help='Desired number of nodes (overrides template)'
-        )
+        _add_argument_specs(parser.add_argument_group('Container-First Options'), _CONTAINER_FIRST_ARGS)
+        _add_argument_specs(parser.add_argument_group('Extraction Mode Options'), _EXTRACTION_ARGS)
+        _add_argument_specs(parser.add_argument_group('Nodegroup Configuration'), _NODEGROUP_ARGS)
+        _add_argument_specs(parser.add_argument_group('Template Overrides'), _OVERRIDE_ARGS)
         
         # AWS configuration
         aws_group = parser.add_argument_group('AWS Options')
         add_aws_args(aws_group)
-        aws_group.add_argument(
-            '--ubuntu-version',
-            default='ubuntu2204',
-            help='Ubuntu version for driver resolution (default: ubuntu2204)'
-        )
+        _add_argument_specs(aws_group, _AWS_ARGS)
         
-        # Execution options
-        execution_group = parser.add_argument_group('Execution Options')
-        execution_group.add_argument(
-            '--plan-only',
-            action='store_true',
-            help='Only show the alignment plan without executing'
-        )
-        execution_group.add_argument(
-            '--output-file', '-o',
-            help='Output file for nodegroup configuration'
-        )
-        execution_group.add_argument(
-            '--generate-template',
-            action='store_true',
-            help='Generate a sample nodegroup template file and exit'
-        )
+        _add_argument_specs(parser.add_argument_group('Execution Options'), _EXECUTION_ARGS)
         
         # Output options
         output_group = parser.add_argument_group('Output Options')
         add_output_args(output_group)
-        
-        parser.set_defaults(func=self.execute)
     
     def execute(self, args: argparse.Namespace) -> int:
         """Execute the align command."""
@@ -230,32 +302,28 @@ Examples:
                 'ubuntu_version': args.ubuntu_version,
                 'architecture': architecture,
                 'debug': args.verbose,
+                'refresh_cache': args.refresh_cache,
             }
             
+            # Check if we're in extraction mode; it creates its own per-thread orchestrators
+            if args.extract_from_cluster:
+                return self._execute_extraction_mode(args, architecture, config, formatter)
+            
             # Build template overrides
             template_overrides = self._build_template_overrides(args)
             
             # Initialize orchestrator
+            from eks_nvidia_alignment import DriverAlignmentOrchestrator
             orchestrator = DriverAlignmentOrchestrator(config)
             
-            # Check if we're in extraction mode
-            if args.extract_from_cluster:
-                return self._execute_extraction_mode(args, architecture, formatter)
-            
             # Execute alignment strategy (non-extraction mode)
             print_separator(f"Driver Alignment - {args.strategy.title()} Strategy", not args.quiet)
             
-            if args.strategy == 'ami-first':
-                alignment = self._execute_ami_first(
-                    orchestrator, args, architecture, formatter
-                )
-            else:
-                alignment = self._execute_container_first(
-                    orchestrator, args, architecture, formatter
-                )
-            
-            if alignment is None:
-                return 1
+            execute_strategy = {
+                'ami-first': self._execute_ami_first,
+                'container-first': self._execute_container_first,
+            }[args.strategy]
+            alignment = execute_strategy(orchestrator, args, architecture, formatter)
             
             # Show alignment results
             formatter.print_alignment_results(alignment)
@@ -271,9 +339,11 @@ Examples:
             
             return 0
             
+        except AlignmentError as e:
+            formatter.print_status(str(e), 'error')
+            return 1
         except Exception as e:
             if args.verbose:
-                import traceback
                 traceback.print_exc()
             else:
                 print(f"Error: {e}")
@@ -282,74 +352,45 @@ Examples:
     def _validate_arguments(self, args: argparse.Namespace, 
                           formatter: OutputFormatter) -> int:
         """Validate command arguments."""
-        # Validate AWS arguments
-        try:
-            validate_aws_profile(args.profile)
-            validate_aws_region(args.region)
-        except ValidationError as e:
-            formatter.print_status(str(e), 'error')
-            return 1
-        
-        # Validate Kubernetes version if provided
+        # Format checks as (validator, value); optional values are only checked when provided
+        checks = [
+            (validate_aws_profile, args.profile),
+            (validate_aws_region, args.region),
+        ]
         if args.k8s_version:
-            try:
-                validate_k8s_version(args.k8s_version)
-            except ValidationError as e:
-                formatter.print_status(str(e), 'error')
-                return 1
-        
-        # Validate cluster name if provided
+            checks.append((validate_k8s_version, args.k8s_version))
         if args.cluster_name:
-            try:
-                validate_cluster_name(args.cluster_name)
-            except ValidationError as e:
-                formatter.print_status(str(e), 'error')
-                return 1
-        
-        # Validate extraction mode
+            checks.append((validate_cluster_name, args.cluster_name))
         if args.extract_from_cluster:
-            # Validate extract-from-cluster name
-            try:
-                validate_cluster_name(args.extract_from_cluster)
-            except ValidationError as e:
-                formatter.print_status(str(e), 'error')
-                return 1
-            
-            # Validate target cluster if provided
+            checks.append((validate_cluster_name, args.extract_from_cluster))
             if args.target_cluster:
-                try:
-                    validate_cluster_name(args.target_cluster)
-                except ValidationError as e:
-                    formatter.print_status(str(e), 'error')
-                    return 1
-        else:
-            # Non-extraction mode: Either cluster-name OR k8s-version must be provided
-            if not args.cluster_name and not args.k8s_version:
-                formatter.print_status(
-                    "Either --cluster-name (for auto-detection) or --k8s-version (manual) is required",
-                    'error'
-                )
-                return 1
+                checks.append((validate_cluster_name, args.target_cluster))
+        if args.strategy == 'container-first' and args.current_driver_version:
+            checks.append((validate_driver_version, args.current_driver_version))
+        
+        if not _run_validators(checks, formatter):
+            return 1
+        
+        # Non-extraction mode: Either cluster-name OR k8s-version must be provided
+        if not args.extract_from_cluster and not args.cluster_name and not args.k8s_version:
+            formatter.print_status(
+                "Either --cluster-name (for auto-detection) or --k8s-version (manual) is required",
+                'error'
+            )
+            return 1
         
         # Validate strategy-specific arguments
-        if args.strategy == 'container-first':
-            if not args.current_driver_version:
-                formatter.print_status(
-                    "--current-driver-version is required for container-first strategy",
-                    'error'
-                )
-                return 1
-            
-            try:
-                validate_driver_version(args.current_driver_version)
-            except ValidationError as e:
-                formatter.print_status(str(e), 'error')
-                return 1
+        if args.strategy == 'container-first' and not args.current_driver_version:
+            formatter.print_status(
+                "--current-driver-version is required for container-first strategy",
+                'error'
+            )
+            return 1
         
         # Validate template requirements (only for non-extraction mode)
         if not args.extract_from_cluster:
             template_will_provide = (
-                (args.template and os.path.exists(args.template)) or
+                _path_exists(args.template) or
                 find_template_file() is not None
             )
             
@@ -367,16 +408,13 @@ Examples:
                         missing_required.append(cli_arg)
                 
                 if missing_required:
-                    formatter.print_status(
-                        "No template file found and missing required arguments:",
-                        'error'
-                    )
-                    for field in missing_required:
-                        formatter.print_status(f"  {field}", 'error')
-                    formatter.print_status(
+                    messages = [("No template file found and missing required arguments:", 'error')]
+                    messages.extend((f"  {field}", 'error') for field in missing_required)
+                    messages.append((
                         "Either generate a template with 'eks-nvidia-tools align --generate-template' or provide required arguments",
                         'info'
-                    )
+                    ))
+                    formatter.print_status_batch(messages)
                     return 1
         
         return 0
@@ -396,14 +434,10 @@ Examples:
             return 1
         
         # Architecture-specific defaults
-        if architecture == "arm64":
-            default_instances = ["g5g.xlarge"]
-            default_ami_type = "AL2023_ARM_64_NVIDIA"
-            default_arch_label = "arm64"
-        else:
-            default_instances = ["g4dn.xlarge"]
-            default_ami_type = "AL2023_x86_64_NVIDIA"
-            default_arch_label = "amd64"
+        default_instances, default_ami_type, default_arch_label = _TEMPLATE_ARCH_DEFAULTS.get(
+            architecture, _TEMPLATE_ARCH_DEFAULTS["x86_64"]
+        )
+        default_instances = list(default_instances)
         
         sample_template = {
             # Required parameters
@@ -454,25 +488,28 @@ Examples:
         }
         
         try:
-            import json
-            with open(template_filename, 'w') as f:
-                json.dump(sample_template, f, indent=2)
+            json_utils.dump_to_file(template_filename, sample_template)
             
-            arch_display = architecture.upper() if architecture == "arm64" else "x86_64"
+            arch_display = _ARCH_DISPLAY.get(architecture, "x86_64")
             formatter.print_status(f"Generated {arch_display} template: {template_filename}", 'success')
             
-            formatter.print_status("Required fields (must be edited):", 'info')
-            if not args.cluster_name:
-                formatter.print_status("  • clusterName: Specify your EKS cluster name", 'info')
-            if not args.node_role_arn:
-                formatter.print_status("  • nodeRole: Replace YOUR_ACCOUNT_ID with your AWS account ID", 'info')
-            if not args.subnet_ids:
-                formatter.print_status("  • subnets: Replace with your actual subnet IDs", 'info')
-            
-            formatter.print_status(f"Template configured for {arch_display} architecture:", 'info')
-            formatter.print_status(f"  • instanceTypes: {default_instances}", 'info')
-            formatter.print_status(f"  • amiType: {default_ami_type}", 'info')
-            formatter.print_status(f"  • kubernetes.io/arch: {default_arch_label}", 'info')
+            # Info-level guidance is dropped in quiet mode, so skip formatting it entirely
+            if not formatter.quiet:
+                guidance = ["Required fields (must be edited):"]
+                if not args.cluster_name:
+                    guidance.append("  • clusterName: Specify your EKS cluster name")
+                if not args.node_role_arn:
+                    guidance.append("  • nodeRole: Replace YOUR_ACCOUNT_ID with your AWS account ID")
+                if not args.subnet_ids:
+                    guidance.append("  • subnets: Replace with your actual subnet IDs")
+                
+                guidance.extend((
+                    f"Template configured for {arch_display} architecture:",
+                    f"  • instanceTypes: {default_instances}",
+                    f"  • amiType: {default_ami_type}",
+                    f"  • kubernetes.io/arch: {default_arch_label}",
+                ))
+                formatter.print_status_batch([(line, 'info') for line in guidance])
             
             return 0
             
@@ -482,39 +519,25 @@ Examples:
     
     def _build_template_overrides(self, args: argparse.Namespace) -> Dict[str, Any]:
         """Build template overrides from command line arguments."""
-        template_overrides = {}
+        # Common case: no overrides given, the template is used as-is
+        if all(getattr(args, attr, None) is None for attr in _OVERRIDE_ATTRS):
+            return {}
         
         # Add nodegroup-specific overrides
-        if args.nodegroup_name:
-            template_overrides["nodegroupName"] = args.nodegroup_name
-        if args.instance_types:
-            template_overrides["instanceTypes"] = args.instance_types
-        if args.subnet_ids:
-            template_overrides["subnets"] = args.subnet_ids
-        if args.node_role_arn:
-            template_overrides["nodeRole"] = args.node_role_arn
-        if args.capacity_type:
-            template_overrides["capacityType"] = args.capacity_type
-        if args.disk_size:
-            template_overrides["diskSize"] = args.disk_size
-        
-        # Add scaling configuration if any scaling parameters provided
-        scaling_config = {}
-        if args.min_size is not None:
-            scaling_config["minSize"] = args.min_size
-        if args.max_size is not None:
-            scaling_config["maxSize"] = args.max_size
-        if args.desired_size is not None:
-            scaling_config["desiredSize"] = args.desired_size
+        template_overrides = {key: getattr(args, attr) for attr, key in _OVERRIDE_MAP if getattr(args, attr)}
         
+        # Add scaling configuration if any scaling parameters provided (0 is a valid size)
+        scaling_config = {
+            key: getattr(args, attr) for attr, key in _SCALING_MAP if getattr(args, attr) is not None
+        }
         if scaling_config:
             template_overrides["scalingConfig"] = scaling_config
         
         return template_overrides
     
-    def _execute_ami_first(self, orchestrator: DriverAlignmentOrchestrator,
+    def _execute_ami_first(self, orchestrator: 'DriverAlignmentOrchestrator',
                           args: argparse.Namespace, architecture: str,
-                          formatter: OutputFormatter) -> Optional[DriverAlignment]:
+                          formatter: OutputFormatter) -> DriverAlignment:
         """Execute ami-first strategy."""
         with progress("Finding latest AMI for Kubernetes version", not args.quiet):
             alignment = orchestrator.align_drivers_ami_first(
@@ -526,9 +549,9 @@ Examples:
         formatter.print_status("AMI-first strategy completed", 'success')
         return alignment
     
-    def _execute_container_first(self, orchestrator: DriverAlignmentOrchestrator,
+    def _execute_container_first(self, orchestrator: 'DriverAlignmentOrchestrator',
                                 args: argparse.Namespace, architecture: str,
-                                formatter: OutputFormatter) -> Optional[DriverAlignment]:
+                                formatter: OutputFormatter) -> DriverAlignment:
         """Execute container-first strategy."""
         with progress("Finding compatible AMI for driver version", not args.quiet):
             alignment = orchestrator.align_drivers_container_first(
@@ -539,16 +562,12 @@ Examples:
             )
         
         if alignment is None:
-            formatter.print_status(
-                "Container-first strategy failed: Please specify an exact driver version",
-                'error'
-            )
-            return None
+            raise AlignmentError("Container-first strategy failed: Please specify an exact driver version")
         
         formatter.print_status("Container-first strategy completed", 'success')
         return alignment
     
-    def _execute_alignment(self, orchestrator: DriverAlignmentOrchestrator,
+    def _execute_alignment(self, orchestrator: 'DriverAlignmentOrchestrator',
                           alignment: DriverAlignment, args: argparse.Namespace,
                           architecture: str, template_overrides: Dict[str, Any],
                           formatter: OutputFormatter) -> int:
@@ -556,7 +575,7 @@ Examples:
         print_separator("Executing Alignment", not args.quiet)
         
         # Use nodegroup name from args, or fallback to architecture-specific default
-        arch_suffix = f"-{architecture}" if architecture == "arm64" else ""
+        arch_suffix = _ARCH_SUFFIX.get(architecture, "")
         nodegroup_name = args.nodegroup_name or f"gpu-workers{arch_suffix}"
         
         try:
@@ -570,7 +589,7 @@ Examples:
                     output_file=args.output_file
                 )
             
-            arch_display = architecture.upper() if architecture == "arm64" else "x86_64"
+            arch_display = _ARCH_DISPLAY.get(architecture, "x86_64")
             formatter.print_status(f"{arch_display} configuration generation completed!", 'success')
             formatter.print_status(
                 "Use the generated configuration to create your nodegroup when ready",
@@ -586,9 +605,11 @@ Examples:
     # Old extract-and-recreate method removed - functionality moved to extraction mode
 
     def _execute_extraction_mode(self, args: argparse.Namespace, architecture: str,
-                                formatter: OutputFormatter) -> int:
+                                config: Dict[str, Any], formatter: OutputFormatter) -> int:
         """Execute extraction mode with the chosen strategy."""
         try:
+            from core.eks_client import EKSClient
+            
             # Initialize EKS client and orchestrator
             eks_client = EKSClient(
                 profile=args.profile,
@@ -596,24 +617,13 @@ Examples:
                 verbose=args.verbose
             )
             
-            # Store region for later use (will be used when generating JSON)
-            cluster_region = args.region
-            
-            config = {
-                'aws_profile': args.profile,
-                'aws_region': args.region,
-                'ubuntu_version': args.ubuntu_version,
-                'architecture': architecture,
-                'debug': args.verbose,
-            }
-            orchestrator = DriverAlignmentOrchestrator(config)
+            from eks_nvidia_alignment import DriverAlignmentOrchestrator
             
             source_cluster = args.extract_from_cluster
             target_cluster = args.target_cluster or source_cluster
             
-            # Generate timestamp suffix if none provided
+            # Generate one random suffix for the whole run if none provided
             if args.new_nodegroup_suffix is None:
-                import os
                 nodegroup_suffix = f'-{os.urandom(2).hex()}'
             else:
                 nodegroup_suffix = args.new_nodegroup_suffix
@@ -649,36 +659,60 @@ Examples:
             
             print_step(3, 4, f"Applying {args.strategy} strategy to each nodegroup", not args.quiet)
             
-            # Apply strategy to each extracted nodegroup
+            # Nodegroups on the same Kubernetes version share one alignment, so the strategy
+            # runs once per version rather than once per nodegroup
+            nodegroup_versions = []
+            for i, ng in enumerate(nodegroups):
+                formatter.print_status(f"Processing nodegroup {i+1}/{len(nodegroups)}: {ng.nodegroup_name}", 'info')
+                nodegroup_versions.append((ng, args.k8s_version or ng.version or "1.32"))  # fallback
+            k8s_versions = list(dict.fromkeys(version for _, version in nodegroup_versions))
+            
+            # Resolve the versions concurrently. Each worker thread gets its own orchestrator,
+            # since boto3 sessions must not be shared across threads. The orchestrator prints
+            # as it goes, so each version's output is buffered and shown once all are done.
+            worker_state = threading.local()
+            version_output = {}
+            
+            def align_version(k8s_version):
+                with output_capture.capture() as buffer:
+                    try:
+                        if not hasattr(worker_state, 'orchestrator'):
+                            worker_state.orchestrator = DriverAlignmentOrchestrator(config)
+                        return self._align_k8s_version(worker_state.orchestrator, k8s_version, args, architecture)
+                    finally:
+                        version_output[k8s_version] = buffer.getvalue()
+            
+            with ThreadOutputCapture() as output_capture:
+                with ThreadPoolExecutor(max_workers=min(_MAX_EXTRACTION_WORKERS, len(k8s_versions))) as executor:
+                    version_futures = {version: executor.submit(align_version, version) for version in k8s_versions}
+            
+            for k8s_version in k8s_versions:
+                formatter.print_captured(version_output.get(k8s_version, ''))
+            
+            # Collect in extraction order so saved files and summaries stay deterministic
             all_alignments = []
             failed_alignments = []
             
-            for i, ng in enumerate(nodegroups):
-                print(f"\nProcessing nodegroup {i+1}/{len(nodegroups)}: {ng.nodegroup_name}")
-                
+            for ng, k8s_version in nodegroup_versions:
                 try:
-                    if args.strategy == 'ami-first':
-                        alignment = self._apply_ami_first_to_nodegroup(
-                            orchestrator, ng, args, architecture, nodegroup_suffix, target_cluster, formatter
-                        )
-                    else:  # container-first
-                        alignment = self._apply_container_first_to_nodegroup(
-                            orchestrator, ng, args, architecture, nodegroup_suffix, target_cluster, formatter
-                        )
-                    
+                    alignment = version_futures[k8s_version].result()
                     if alignment:
-                        all_alignments.append((ng, alignment))
+                        all_alignments.append((ng, self._apply_alignment_to_nodegroup(
+                            alignment, ng, nodegroup_suffix, target_cluster
+                        )))
                     else:
                         failed_alignments.append(ng.nodegroup_name)
-                        
                 except Exception as e:
-                    formatter.print_status(f"Failed to process {ng.nodegroup_name}: {e}", 'error')
+                    formatter.print_status(f"Failed {args.strategy} for {ng.nodegroup_name}: {e}", 'error')
                     failed_alignments.append(ng.nodegroup_name)
             
             print_step(4, 4, "Generating aligned configurations", not args.quiet)
             
             # Save all alignments to file
             if all_alignments:
+                # Nodegroups sharing a Kubernetes version, AMI type and release date share one lookup
+                release_versions = self._resolve_release_versions(all_alignments, eks_client)
+                
                 # Generate separate JSON file for each nodegroup using original name + new timestamp
                 saved_files = []
                 for ng, alignment in all_alignments:
@@ -691,7 +725,7 @@ Examples:
                         # Use the new nodegroup name directly as filename (it already has the correct timestamp)
                         output_file = get_output_path(f"{new_nodegroup_name}.json")
                     
-                    json_file = self._save_nodegroup_config(ng, alignment, output_file, formatter, args.profile, cluster_region)
+                    json_file = self._save_nodegroup_config(ng, alignment, output_file, formatter, release_versions)
                     if json_file:
                         saved_files.append((json_file, ng, alignment))
                 
@@ -709,83 +743,43 @@ Examples:
         except Exception as e:
             formatter.print_status(f"Extraction mode failed: {e}", 'error')
             if args.verbose:
-                import traceback
                 traceback.print_exc()
             return 1
     
-    def _apply_ami_first_to_nodegroup(self, orchestrator, ng: NodegroupInfo, 
-                                     args: argparse.Namespace, architecture: str,
-                                     nodegroup_suffix: str, target_cluster: str,
-                                     formatter: OutputFormatter):
-        """Apply ami-first strategy to a single extracted nodegroup."""
-        try:
-            # Get cluster info to determine K8s version if not provided
-            if args.k8s_version:
-                k8s_version = args.k8s_version
-            else:
-                # Extract K8s version from the cluster
-                k8s_version = ng.version or "1.32"  # fallback
-            
-            # Execute ami-first alignment
-            alignment = orchestrator.align_drivers_ami_first(
+    def _align_k8s_version(self, orchestrator, k8s_version: str, args: argparse.Namespace,
+                           architecture: str) -> Optional[DriverAlignment]:
+        """Run the chosen strategy once for a Kubernetes version shared by extracted nodegroups."""
+        if args.strategy == 'ami-first':
+            return orchestrator.align_drivers_ami_first(
                 k8s_version=k8s_version,
                 architecture=architecture,
                 cluster_name=None  # We're not using cluster auto-detection
             )
-            
-            if alignment:
-                # Update the alignment with extracted nodegroup info
-                alignment.nodegroup_config = self._merge_extracted_config(
-                    ng, alignment.nodegroup_config, nodegroup_suffix, target_cluster
-                )
-                
-            return alignment
-            
-        except Exception as e:
-            formatter.print_status(f"Failed ami-first for {ng.nodegroup_name}: {e}", 'error')
-            return None
+        
+        # container-first
+        return orchestrator.align_drivers_container_first(
+            current_driver_version=args.current_driver_version,
+            architecture=architecture,
+            k8s_version=k8s_version,
+            cluster_name=None  # We're not using cluster auto-detection
+        )
     
-    def _apply_container_first_to_nodegroup(self, orchestrator, ng: NodegroupInfo,
-                                           args: argparse.Namespace, architecture: str,
-                                           nodegroup_suffix: str, target_cluster: str,
-                                           formatter: OutputFormatter):
-        """Apply container-first strategy to a single extracted nodegroup."""
-        try:
-            # Get cluster info to determine K8s version if not provided
-            if args.k8s_version:
-                k8s_version = args.k8s_version
-            else:
-                # Extract K8s version from the cluster
-                k8s_version = ng.version or "1.32"  # fallback
-            
-            # Execute container-first alignment
-            alignment = orchestrator.align_drivers_container_first(
-                current_driver_version=args.current_driver_version,
-                architecture=architecture,
-                k8s_version=k8s_version,
-                cluster_name=None  # We're not using cluster auto-detection
-            )
-            
-            if alignment:
-                # Update the alignment with extracted nodegroup info
-                alignment.nodegroup_config = self._merge_extracted_config(
-                    ng, alignment.nodegroup_config, nodegroup_suffix, target_cluster
-                )
-            
-            return alignment
-            
-        except Exception as e:
-            formatter.print_status(f"Failed container-first for {ng.nodegroup_name}: {e}", 'error')
-            return None
+    def _apply_alignment_to_nodegroup(self, alignment: DriverAlignment, ng: 'NodegroupInfo',
+                                      nodegroup_suffix: str, target_cluster: str) -> DriverAlignment:
+        """Copy a shared alignment and merge in the extracted nodegroup's configuration."""
+        ng_alignment = copy.copy(alignment)
+        ng_alignment.nodegroup_config = self._merge_extracted_config(
+            ng, alignment.nodegroup_config, nodegroup_suffix, target_cluster
+        )
+        return ng_alignment
     
-    def _merge_extracted_config(self, ng: NodegroupInfo, alignment_config: Dict[str, Any],
+    def _merge_extracted_config(self, ng: 'NodegroupInfo', alignment_config: Dict[str, Any],
                                nodegroup_suffix: str, target_cluster: str) -> Dict[str, Any]:
         """Merge extracted nodegroup configuration with alignment results."""
         # Start with the extracted nodegroup template
         merged_config = ng.to_template_dict()
         
         # Get base nodegroup name without any existing auto-generated suffix
-        from utils.naming_utils import strip_nodegroup_suffix
         base_name = strip_nodegroup_suffix(ng.nodegroup_name)
         
         # Update with alignment-specific settings
@@ -800,58 +794,57 @@ Examples:
         
         return merged_config
     
-    def _save_nodegroup_config(self, ng: NodegroupInfo, alignment: DriverAlignment, 
+    def _release_lookup_key(self, alignment: DriverAlignment) -> tuple:
+        """Key identifying the AMI release version lookup needed for an alignment."""
+        return (alignment.k8s_version, alignment.nodegroup_config.get("amiType"),
+                alignment.ami_release_version)
+    
+    def _resolve_release_versions(self, alignments: List[tuple],
+                                  eks_client: 'EKSClient') -> Dict[tuple, Any]:
+        """Look up the actual AMI release version once per distinct key, concurrently.
+        
+        Failed lookups map to their exception so each nodegroup can report it.
+        """
+        keys = list(dict.fromkeys(self._release_lookup_key(alignment) for _, alignment in alignments))
+        
+        def resolve(key):
+            k8s_version, ami_type, ami_release_version = key
+            try:
+                # Extract release date from ami_release_version (e.g., "20250519" or "v20250519")
+                release_date = ami_release_version.lstrip('v')
+                return eks_client.get_release_version_for_date(k8s_version, ami_type, release_date)
+            except Exception as e:
+                return e
+        
+        # boto3 clients are thread-safe, so the workers share this client
+        with ThreadPoolExecutor(max_workers=min(_MAX_EXTRACTION_WORKERS, len(keys))) as executor:
+            return dict(zip(keys, executor.map(resolve, keys)))
+    
+    def _save_nodegroup_config(self, ng: 'NodegroupInfo', alignment: DriverAlignment, 
                               output_file: str, formatter: OutputFormatter,
-                              aws_profile: str = None, aws_region: str = None) -> Optional[str]:
+                              release_versions: Dict[tuple, Any]) -> Optional[str]:
         """Save single nodegroup configuration to AWS CLI compatible JSON file."""
+        # Status lines for this nodegroup go out in one batch; info lines are only
+        # formatted when they will be shown
+        messages = []
         try:
-            import json
-            
             # AWS CLI compatible configuration
-            aws_config = alignment.nodegroup_config.copy()
-            
-            # Get the actual AMI release version for the selected release date
-            try:
-                # Initialize EKS client to get release version
-                eks_client = EKSClient(
-                    profile=aws_profile,
-                    region=aws_region,
-                    verbose=False
-                )
-
-                # Extract release date from ami_release_version (e.g., "20250519" or "v20250519")
-                release_date = alignment.ami_release_version.lstrip('v')
-
-                # Get the full release version for this specific date
-                actual_release_version = eks_client.get_release_version_for_date(
-                    alignment.k8s_version,
-                    aws_config.get("amiType"),
-                    release_date
-                )
-
-                formatter.print_status(f"Using actual AMI release version: {actual_release_version}", 'info')
-
-            except Exception as e:
-                formatter.print_status(f"Warning: Could not get actual AMI release version: {e}", 'warning')
-                formatter.print_status(f"Using alignment release version: {alignment.release_tag}", 'info')
+            aws_config = alignment.nodegroup_config  # only read below; nested dicts are copied before filtering
+            
+            # Actual AMI release version for the selected release date, resolved up front
+            actual_release_version = release_versions[self._release_lookup_key(alignment)]
+            if isinstance(actual_release_version, Exception):
+                messages.append((f"Warning: Could not get actual AMI release version: {actual_release_version}", 'warning'))
+                if not formatter.quiet:
+                    messages.append((f"Using alignment release version: {alignment.release_tag}", 'info'))
                 actual_release_version = alignment.release_tag
+            elif not formatter.quiet:
+                messages.append((f"Using actual AMI release version: {actual_release_version}", 'info'))
             
             # AWS CLI compatible configuration with proper release version
-            aws_cli_config = {
-                "clusterName": aws_config.get("clusterName"),
-                "nodegroupName": aws_config.get("nodegroupName"),
-                "scalingConfig": aws_config.get("scalingConfig", {}),
-                "instanceTypes": aws_config.get("instanceTypes", []),
-                "amiType": aws_config.get("amiType"),
-                "releaseVersion": actual_release_version,  # Actual AWS EKS release version
-                "nodeRole": aws_config.get("nodeRole"),
-                "subnets": aws_config.get("subnets", []),
-                "capacityType": aws_config.get("capacityType", "ON_DEMAND"),
-                "diskSize": aws_config.get("diskSize", 50),
-                "labels": aws_config.get("labels", {}),
-                "taints": aws_config.get("taints", []),
-                "tags": aws_config.get("tags", {})
-            }
+            get = aws_config.get
+            aws_cli_config = {key: get(key, default) for key, default in _SAVED_CONFIG_FIELDS}
+            aws_cli_config["releaseVersion"] = actual_release_version  # Actual AWS EKS release version
             
             # Add optional fields if present, but filter out invalid fields
             if aws_config.get("updateConfig"):
@@ -874,91 +867,99 @@ Examples:
                 aws_cli_config["remoteAccess"] = aws_config["remoteAccess"]
             
             # Save single nodegroup configuration
-            with open(output_file, 'w') as f:
-                json.dump(aws_cli_config, f, indent=2)
+            json_utils.dump_to_file(output_file, aws_cli_config)
             
-            formatter.print_status(f"Configuration saved to: {output_file}", 'success')
+            messages.append((f"Configuration saved to: {output_file}", 'success'))
+            formatter.print_status_batch(messages)
             return output_file
             
         except Exception as e:
-            formatter.print_status(f"Warning: Failed to save {output_file}: {e}", 'warning')
+            messages.append((f"Warning: Failed to save {output_file}: {e}", 'warning'))
+            formatter.print_status_batch(messages)
             return None
     
     def _display_extraction_next_steps(self, saved_files: List[tuple], formatter: OutputFormatter) -> None:
         """Display next steps for extraction results."""
         formatter.print_status("Generated Files:", 'info')
-        for json_file, ng, alignment in saved_files:
-            print(f"  📄 {json_file}")
-        print()
+        lines = [f"  📄 {json_file}" for json_file, ng, alignment in saved_files]
+        lines.append("")
+        print("\n".join(lines))
         
         formatter.print_status("Next Steps:", 'info')
-        print("1. Review and modify configurations if needed:")
+        lines = ["1. Review and modify configurations if needed:"]
         for json_file, ng, alignment in saved_files:
             config = alignment.nodegroup_config
             release_version = alignment.release_tag
             ami_type = config.get('amiType', 'N/A')
-            print(f"   • {json_file}")
-            print(f"     - Release: {release_version} | AMI Type: {ami_type}")
-            print(f"     - Original: {ng.nodegroup_name} → New: {config['nodegroupName']}")
-        print()
-        
-        print("2. Create nodegroups using AWS CLI:")
+            lines.extend((
+                f"   • {json_file}",
+                f"     - Release: {release_version} | AMI Type: {ami_type}",
+                f"     - Original: {ng.nodegroup_name} → New: {config['nodegroupName']}",
+            ))
+        lines.append("")
+        
+        lines.append("2. Create nodegroups using AWS CLI:")
         for json_file, ng, alignment in saved_files:
-            config = alignment.nodegroup_config
-            new_name = config['nodegroupName']
-            cluster_name = config['clusterName']
-            
-            print(f"   # Create {new_name}")
-            print(f"   aws eks create-nodegroup --cli-input-json file://{json_file}")
-            print()
-        
-        print("3. To modify driver versions or releases:")
-        print("   • Edit the JSON files to change:")
-        print("     - releaseVersion: Change AMI release (e.g., '1.31-20250519' → '1.31-20250403')")
-        print("     - amiType: Change AMI type (AL2023_x86_64_NVIDIA, AL2_x86_64_GPU, etc.)")
-        print("   • Re-run alignment with --current-driver-version for different strategy")
-        print("   • Note: Invalid fields for nodegroup creation are automatically filtered out")
-        print()
-        
-        print("4. After verifying new nodegroups work correctly:")
-        print("   • Drain and delete original nodegroups manually")
-        print("   • Update applications to use new nodegroups if needed")
-        print()
+            new_name = alignment.nodegroup_config['nodegroupName']
+            lines.extend((
+                f"   # Create {new_name}",
+                f"   aws eks create-nodegroup --cli-input-json file://{json_file}",
+                "",
+            ))
+        
+        lines.extend((
+            "3. To modify driver versions or releases:",
+            "   • Edit the JSON files to change:",
+            "     - releaseVersion: Change AMI release (e.g., '1.31-20250519' → '1.31-20250403')",
+            "     - amiType: Change AMI type (AL2023_x86_64_NVIDIA, AL2_x86_64_GPU, etc.)",
+            "   • Re-run alignment with --current-driver-version for different strategy",
+            "   • Note: Invalid fields for nodegroup creation are automatically filtered out",
+            "",
+            "4. After verifying new nodegroups work correctly:",
+            "   • Drain and delete original nodegroups manually",
+            "   • Update applications to use new nodegroups if needed",
+            "",
+        ))
+        print("\n".join(lines))
         
         formatter.print_status("⚠ This tool generates configurations only - you must create nodegroups manually", 'warning')
     
-    def _display_extracted_nodegroups(self, nodegroups: List[NodegroupInfo], 
+    def _display_extracted_nodegroups(self, nodegroups: List['NodegroupInfo'], 
                                      formatter: OutputFormatter) -> None:
         """Display extracted nodegroup information."""
         formatter.print_status("Extracted GPU Nodegroups:", 'info')
         
+        # Render every nodegroup into one block and print it with a single write
+        lines = []
         for ng in nodegroups:
-            status_icon = "⚠" if ng.ami_type == 'AL2_x86_64_GPU' else "✓"
-            arch_display = ng.architecture.upper() if ng.architecture == "arm64" else "x86_64"
-            
-            print(f"  {status_icon} {ng.nodegroup_name}")
-            print(f"    AMI Type: {ng.ami_type}")
-            print(f"    Architecture: {arch_display}")
-            print(f"    Instance Types: {', '.join(ng.instance_types)}")
-            print(f"    Status: {ng.status}")
-            
-            if ng.ami_type == 'AL2_x86_64_GPU':
-                print(f"    ⚠ Warning: Uses deprecated AL2 AMI (EOL: 2024-11-26)")
-            print()
+            is_al2 = ng.ami_type == 'AL2_x86_64_GPU'
+            status_icon = "⚠" if is_al2 else "✓"
+            arch_display = _ARCH_DISPLAY.get(ng.architecture, "x86_64")
+            
+            lines.extend((
+                f"  {status_icon} {ng.nodegroup_name}",
+                f"    AMI Type: {ng.ami_type}",
+                f"    Architecture: {arch_display}",
+                f"    Instance Types: {', '.join(ng.instance_types)}",
+                f"    Status: {ng.status}",
+            ))
+            if is_al2:
+                lines.append("    ⚠ Warning: Uses deprecated AL2 AMI (EOL: 2024-11-26)")
+            lines.append("")
+        
+        if lines:
+            print("\n".join(lines))
     
     
     def _save_aligned_configurations(self, aligned_configs: List[tuple], 
                                    output_file: str, formatter: OutputFormatter) -> None:
         """Save aligned configurations to file."""
         try:
-            import json
             configurations = [config for _, config in aligned_configs]
-            
-            with open(output_file, 'w') as f:
-                json.dump(configurations, f, indent=2)
+            json_utils.dump_to_file(output_file, configurations)
             
             formatter.print_status(f"Aligned configurations saved to: {output_file}", 'info')
-            
+        
         except Exception as e:
             formatter.print_status(f"Warning: Failed to save configurations: {e}", 'warning')
     
@@ -967,34 +968,42 @@ Examples:
         """Display next steps for using the generated configurations."""
         formatter.print_status("Next Steps:", 'info')
         
-        print(f"1. Review the generated configurations in: {output_file}")
-        print("2. Create nodegroups using AWS CLI or Console:")
-        print()
+        lines = [
+            f"1. Review the generated configurations in: {output_file}",
+            "2. Create nodegroups using AWS CLI or Console:",
+            "",
+        ]
         
         for original_ng, aligned_config in validated_configs:
             new_name = aligned_config['nodegroupName']
             cluster_name = aligned_config['clusterName']
-            
-            print(f"   # Create {new_name}")
-            print(f"   aws eks create-nodegroup \\")
-            print(f"     --cluster-name {cluster_name} \\")
-            print(f"     --nodegroup-name {new_name} \\")
-            print(f"     --node-role {aligned_config['nodeRole']} \\")
-            print(f"     --subnets {' '.join(aligned_config['subnets'])} \\")
-            print(f"     --instance-types {' '.join(aligned_config['instanceTypes'])} \\")
-            print(f"     --ami-type {aligned_config['amiType']} \\")
-            print(f"     --capacity-type {aligned_config['capacityType']} \\")
-            print(f"     --disk-size {aligned_config['diskSize']} \\")
-            print(f"     --scaling-config minSize={aligned_config['scalingConfig']['minSize']},maxSize={aligned_config['scalingConfig']['maxSize']},desiredSize={aligned_config['scalingConfig']['desiredSize']}")
+            scaling = aligned_config['scalingConfig']
+            
+            lines.extend((
+                f"   # Create {new_name}",
+                "   aws eks create-nodegroup \\",
+                f"     --cluster-name {cluster_name} \\",
+                f"     --nodegroup-name {new_name} \\",
+                f"     --node-role {aligned_config['nodeRole']} \\",
+                f"     --subnets {' '.join(aligned_config['subnets'])} \\",
+                f"     --instance-types {' '.join(aligned_config['instanceTypes'])} \\",
+                f"     --ami-type {aligned_config['amiType']} \\",
+                f"     --capacity-type {aligned_config['capacityType']} \\",
+                f"     --disk-size {aligned_config['diskSize']} \\",
+                f"     --scaling-config minSize={scaling['minSize']},maxSize={scaling['maxSize']},desiredSize={scaling['desiredSize']}",
+            ))
             
             if aligned_config.get('labels'):
                 labels_str = ','.join([f"{k}={v}" for k, v in aligned_config['labels'].items()])
-                print(f"     --labels {labels_str} \\")
-            
-            print()
-        
-        print("3. After verifying the new nodegroups work correctly:")
-        print("   - Drain and delete the original nodegroups manually")
-        print("   - Update your applications to use the new nodegroups if needed")
-        print()
-        print("⚠ This tool only generates configurations - you must create the nodegroups manually")
\ No newline at end of file
+                lines.append(f"     --labels {labels_str} \\")
+            
+            lines.append("")
+        
+        lines.extend((
+            "3. After verifying the new nodegroups work correctly:",
+            "   - Drain and delete the original nodegroups manually",
+            "   - Update your applications to use the new nodegroups if needed",
+            "",
+            "⚠ This tool only generates configurations - you must create the nodegroups manually",
+        ))
+        print("\n".join(lines))
\ No newline at end of file
@@ -5,21 +5,36 @@ This command queries EKS nodegroups and reports their NVIDIA driver versions.
 """
 
 import argparse
-import json
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional
 
-import yaml
-from tabulate import tabulate
-
-from core.eks_client import EKSClient, EKSClientError, NodegroupInfo
 from core.ami_resolver import EKSAMIResolver, AMIResolutionError
 from models.ami_types import AMIType
+from utils import json_utils
 
 from ..shared.arguments import add_aws_args, add_cluster_args, add_output_args
 from ..shared.output import OutputFormatter
 from ..shared.validation import validate_cluster_name, ValidationError
 from ..shared.progress import progress, print_step
 
+if TYPE_CHECKING:
+    # The EKS client pulls in boto3; it is imported when a cluster is actually inspected
+    from core.eks_client import NodegroupInfo
+
+
+# Upper bound on concurrent driver version lookups
+_MAX_RESOLVE_WORKERS = 16
+
+
+@lru_cache(maxsize=32)
+def _ami_type(value: str) -> Optional[AMIType]:
+    """Parse an EKS AMI type string once per distinct value; None if it is unknown."""
+    try:
+        return AMIType(value)
+    except ValueError:
+        return None
+
 
 class InspectCommand:
     """Nodegroup driver inspection subcommand."""
@@ -93,6 +108,8 @@ Examples:
 
             formatter = OutputFormatter(args.output, args.quiet)
 
+            from core.eks_client import EKSClient, EKSClientError
+
             # Initialize clients
             try:
                 eks_client = EKSClient(
@@ -132,10 +149,7 @@ Examples:
                 elif args.all_nodegroups:
                     # All nodegroups
                     nodegroup_names = eks_client.list_nodegroups(args.cluster_name)
-                    nodegroups = [
-                        eks_client.get_nodegroup_info(args.cluster_name, name)
-                        for name in nodegroup_names
-                    ]
+                    nodegroups = eks_client.get_nodegroups_info(args.cluster_name, nodegroup_names)
                 else:
                     # GPU nodegroups only
                     nodegroups = eks_client.get_gpu_nodegroups(args.cluster_name)
@@ -144,21 +158,35 @@ Examples:
                 formatter.print_status("No nodegroups found", 'warning')
                 return 0
 
-            # Resolve driver versions
-            results = []
+            # Resolve driver versions concurrently; each lookup waits on GitHub.
+            # Nodegroups pinned to the same release and AMI type share one lookup.
             with progress("Resolving driver versions", not args.quiet):
+                # Non-GPU nodegroups and ones without a release version have no driver to resolve
+                lookups = {}
                 for ng in nodegroups:
-                    driver_version = self._get_driver_version(
-                        ng, ami_resolver, args.verbose
-                    )
-                    results.append({
+                    if ng.is_gpu_nodegroup and ng.release_version:
+                        lookups.setdefault((ng.release_version, ng.ami_type), ng)
+                
+                driver_versions = {}
+                if lookups:
+                    workers = min(_MAX_RESOLVE_WORKERS, len(lookups))
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        driver_versions = dict(zip(lookups, executor.map(
+                            lambda ng: self._get_driver_version(ng, ami_resolver, args.verbose),
+                            lookups.values()
+                        )))
+                
+                results = [
+                    {
                         'nodegroup': ng.nodegroup_name,
                         'release_version': ng.release_version or 'N/A',
-                        'driver_version': driver_version or 'N/A',
+                        'driver_version': driver_versions.get((ng.release_version, ng.ami_type)) or 'N/A',
                         'ami_type': ng.ami_type,
                         'status': ng.status,
                         'is_gpu': ng.is_gpu_nodegroup
-                    })
+                    }
+                    for ng in nodegroups
+                ]
 
             # Output results
             self._output_results(results, args.output, formatter)
@@ -175,7 +203,7 @@ Examples:
 
     def _get_driver_version(
         self,
-        ng: NodegroupInfo,
+        ng: 'NodegroupInfo',
         ami_resolver: EKSAMIResolver,
         verbose: bool
     ) -> Optional[str]:
@@ -186,9 +214,8 @@ Examples:
         if not ng.is_gpu_nodegroup:
             return None
 
-        try:
-            ami_type = AMIType(ng.ami_type)
-        except ValueError:
+        ami_type = _ami_type(ng.ami_type)
+        if ami_type is None:
             if verbose:
                 print(f"[DEBUG] Unknown AMI type: {ng.ami_type}")
             return None
@@ -210,25 +237,29 @@ Examples:
     ) -> None:
         """Output results in the requested format."""
         if output_format == 'json':
-            print(json.dumps(results, indent=2))
+            # Decode rather than writing bytes, so output still works when stdout has no binary buffer
+            print(json_utils.dumps(results, indent=True).decode('utf-8'))
 
         elif output_format == 'yaml':
-            print(yaml.dump(results, default_flow_style=False, sort_keys=False))
+            import yaml
+            # libyaml emitter, when PyYAML was built with it
+            dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+            print(yaml.dump(results, Dumper=dumper, default_flow_style=False, sort_keys=False))
 
         else:  # table
-            rows = []
-            for r in results:
-                # Add GPU indicator for --all-nodegroups output
-                nodegroup_name = r['nodegroup']
-                if not r['is_gpu']:
-                    nodegroup_name = f"{nodegroup_name} (non-GPU)"
-
-                rows.append([
-                    nodegroup_name,
+            from tabulate import tabulate
+
+            # Rows are produced lazily; tabulate consumes the generator directly
+            rows = (
+                (
+                    # Add GPU indicator for --all-nodegroups output
+                    r['nodegroup'] if r['is_gpu'] else r['nodegroup'] + ' (non-GPU)',
                     r['release_version'],
                     r['driver_version'],
                     r['ami_type']
-                ])
+                )
+                for r in results
+            )
 
             headers = ['Nodegroup', 'Release Version', 'Driver Version', 'AMI Type']
-            print(tabulate(rows, headers=headers, tablefmt='grid'))
+            print(tabulate(rows, headers=headers, tablefmt='grid', disable_numparse=True))
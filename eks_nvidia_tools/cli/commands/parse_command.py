@@ -5,7 +5,8 @@ This command provides AMI parsing functionality using the refactored core module
 """
 
 import argparse
-from typing import Optional, List, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Tuple, Any
 
 # Import the new modular components
 from core.ami_resolver import EKSAMIResolver, AMIResolutionError
@@ -104,6 +105,11 @@ Examples:
             '--debug-release',
             help='Debug a specific release (e.g., v20241121)'
         )
+        debug_group.add_argument(
+            '--refresh-cache',
+            action='store_true',
+            help='Ignore cached GitHub release data and fetch it again'
+        )
         
         parser.set_defaults(func=self.execute)
     
@@ -119,7 +125,7 @@ Examples:
                 return 1
             
             # Initialize components
-            resolver = EKSAMIResolver(verbose=args.verbose)
+            resolver = EKSAMIResolver(verbose=args.verbose, refresh_cache=args.refresh_cache)
             ami_manager = AMITypeManager()
             formatter = OutputFormatter(args.output, args.quiet)
             
@@ -131,31 +137,32 @@ Examples:
             if args.list_versions:
                 return self._list_versions(resolver, formatter)
             
-            # Validate and normalize architecture
+            # Validate and normalize architecture; the enum is resolved once and passed down
             try:
                 architecture = validate_architecture(args.architecture)
-            except ValidationError as e:
+                arch = Architecture.from_string(architecture)
+            except (ValidationError, ValueError) as e:
                 formatter.print_status(str(e), 'error')
                 return 1
             
             # Determine AMI types to search
-            ami_type_strings = self._get_ami_types(
-                args.ami_type, architecture, ami_manager, formatter,
+            ami_types = self._get_ami_types(
+                args.ami_type, arch, ami_manager, formatter,
                 include_deprecated=args.show_deprecated
             )
-            if not ami_type_strings:
+            if not ami_types:
                 return 1
             
             # Handle driver version search
             if args.driver_version:
                 return self._search_by_driver_version(
-                    resolver, args, ami_type_strings, architecture, formatter
+                    resolver, args, ami_types, arch, formatter
                 )
             
             # Handle Kubernetes version search
             if args.k8s_version:
                 return self._search_by_k8s_version(
-                    resolver, args, ami_type_strings, formatter
+                    resolver, args, ami_types, formatter
                 )
             
             # No search criteria provided
@@ -248,39 +255,35 @@ Examples:
             formatter.print_status(f"Error listing versions: {e}", 'error')
             return 1
     
-    def _get_ami_types(self, ami_type_arg: str, architecture: str,
+    def _get_ami_types(self, ami_type_arg: str, arch: Architecture,
                       ami_manager: AMITypeManager, formatter: OutputFormatter,
-                      include_deprecated: bool = False) -> Optional[List[str]]:
+                      include_deprecated: bool = False) -> Optional[List[AMIType]]:
         """Get AMI types to search based on arguments."""
         try:
-            arch = Architecture.from_string(architecture)
-
+            compatible_types = ami_manager.get_ami_types_for_architecture(arch, include_deprecated=include_deprecated)
             if ami_type_arg == 'both':
-                ami_types = ami_manager.get_ami_types_for_architecture(arch, include_deprecated=include_deprecated)
-                return [ami_type.value for ami_type in ami_types]
-            else:
-                # Validate AMI type matches architecture
-                compatible_types = ami_manager.get_ami_types_for_architecture(arch, include_deprecated=include_deprecated)
-                compatible_strings = [ami_type.value for ami_type in compatible_types]
+                return compatible_types
 
-                if ami_type_arg not in compatible_strings:
-                    formatter.print_status(
-                        f"AMI type {ami_type_arg} may not be compatible with architecture {architecture}",
-                        'warning'
-                    )
-                    formatter.print_status(
-                        f"Compatible AMI types for {architecture}: {', '.join(compatible_strings)}",
-                        'info'
-                    )
+            # Validate AMI type matches architecture
+            ami_type = AMIType(ami_type_arg)
+            if ami_type not in compatible_types:
+                formatter.print_status(
+                    f"AMI type {ami_type_arg} may not be compatible with architecture {arch.value}",
+                    'warning'
+                )
+                formatter.print_status(
+                    f"Compatible AMI types for {arch.value}: {', '.join(t.value for t in compatible_types)}",
+                    'info'
+                )
 
-                return [ami_type_arg]
+            return [ami_type]
 
         except ValueError as e:
             formatter.print_status(str(e), 'error')
             return None
     
     def _search_by_driver_version(self, resolver: EKSAMIResolver, args: argparse.Namespace,
-                                 ami_type_strings: List[str], architecture: str,
+                                 ami_types: List[AMIType], arch: Architecture,
                                  formatter: OutputFormatter) -> int:
         """Search for releases by driver version."""
         try:
@@ -301,7 +304,7 @@ Examples:
                 return 1
         
         filter_text = f" for Kubernetes {k8s_version}" if k8s_version else ""
-        arch_text = f" ({architecture})" if architecture != "x86_64" else ""
+        arch_text = f" ({arch.value})" if arch != Architecture.X86_64 else ""
         
         formatter.print_status(
             f"Searching for releases with driver version: {args.driver_version}{filter_text}{arch_text}",
@@ -313,9 +316,7 @@ Examples:
         try:
             with progress("Searching releases", not formatter.quiet):
                 matches = resolver.find_releases_by_driver_version(
-                    args.driver_version, args.fuzzy, k8s_version, 
-                    [AMIType(ami_type) for ami_type in ami_type_strings],
-                    Architecture.from_string(architecture)
+                    args.driver_version, args.fuzzy, k8s_version, ami_types, arch
                 )
             
             if matches:
@@ -333,7 +334,7 @@ Examples:
                     'warning'
                 )
                 
-                if architecture == "arm64":
+                if arch == Architecture.ARM64:
                     formatter.print_status(
                         "ARM64 AMIs may have different driver availability than x86_64",
                         'info'
@@ -349,8 +350,16 @@ Examples:
             formatter.print_status(f"Search failed: {e}", 'error')
             return 1
     
+    def _search_one_ami_type(self, resolver: EKSAMIResolver, ami_type: AMIType,
+                             k8s_version: str, latest: bool,
+                             releases: List[Dict]) -> Optional[Tuple[str, str, str]]:
+        """Look up one AMI type for a Kubernetes version in an already fetched release list."""
+        if latest:
+            return resolver.find_latest_release_for_k8s(k8s_version, ami_type, releases=releases)
+        return resolver.find_kmod_nvidia_version(k8s_version, ami_type, releases=releases)
+    
     def _search_by_k8s_version(self, resolver: EKSAMIResolver, args: argparse.Namespace,
-                              ami_type_strings: List[str], formatter: OutputFormatter) -> int:
+                              ami_types: List[AMIType], formatter: OutputFormatter) -> int:
         """Search for releases by Kubernetes version."""
         try:
             k8s_version = validate_k8s_version(args.k8s_version)
@@ -360,37 +369,34 @@ Examples:
         
         results = []
         
-        # Search each AMI type
-        for i, ami_type_str in enumerate(ami_type_strings):
-            print_step(i + 1, len(ami_type_strings), 
-                      f"Searching {ami_type_str}", not formatter.quiet)
+        # The release list is fetched once and shared; each AMI type is then searched
+        # concurrently and results are reported afterwards in the requested order
+        search_label = "latest release" if args.latest else "first driver version"
+        with progress(f"Finding {search_label} for K8s {k8s_version}", not formatter.quiet):
+            releases = resolver.prefetch_releases()
+            with ThreadPoolExecutor(max_workers=len(ami_types)) as executor:
+                futures = [
+                    executor.submit(self._search_one_ami_type, resolver, ami_type,
+                                    k8s_version, args.latest, releases)
+                    for ami_type in ami_types
+                ]
+        
+        for i, (ami_type, future) in enumerate(zip(ami_types, futures)):
+            print_step(i + 1, len(ami_types), 
+                      f"Searching {ami_type.value}", not formatter.quiet)
             
-            try:
-                ami_type = AMIType(ami_type_str)
-                arch_name = ami_type.architecture.display_name
-                
-                with progress(f"Searching {ami_type_str}", not formatter.quiet) as p:
-                    if args.latest:
-                        p.update(f"Finding latest release for K8s {k8s_version}")
-                        result = resolver.find_latest_release_for_k8s(k8s_version, ami_type)
-                    else:
-                        p.update(f"Finding first driver version for K8s {k8s_version}")
-                        result = resolver.find_kmod_nvidia_version(k8s_version, ami_type)
+            result = future.result()
+            arch_name = ami_type.architecture.display_name
+            if result:
+                release_tag, release_date, kmod_version = result
+                results.append((release_tag, kmod_version, ami_type.value))
                 
-                if result:
-                    release_tag, release_date, kmod_version = result
-                    results.append((release_tag, kmod_version, ami_type.value))
-                    
-                    if not formatter.quiet:
-                        print(f"  ✓ {ami_type_str} ({arch_name}): {kmod_version}")
-                else:
-                    if not formatter.quiet:
-                        search_type = "latest release" if args.latest else "driver version"
-                        print(f"  ✗ {ami_type_str} ({arch_name}): No {search_type} found")
-                        
-            except ValueError as e:
-                formatter.print_status(f"Error with AMI type {ami_type_str}: {e}", 'error')
-                continue
+                if not formatter.quiet:
+                    print(f"  ✓ {ami_type.value} ({arch_name}): {kmod_version}")
+            else:
+                if not formatter.quiet:
+                    search_type = "latest release" if args.latest else "driver version"
+                    print(f"  ✗ {ami_type.value} ({arch_name}): No {search_type} found")
         
         if results:
             formatter.print_ami_results(results)
@@ -5,15 +5,15 @@ This command searches the NVIDIA CUDA repository for driver packages.
 """
 
 import argparse
-import json
 import re
-import urllib.request
-import urllib.error
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 
-import yaml
-from tabulate import tabulate
+import requests
+
+from core.nvidia_repo import CACHE_TTL_SECONDS, iter_listing_lines, listing_cache_key
+from utils import json_utils
 
 from ..shared.output import OutputFormatter
 from ..shared.validation import (
@@ -23,6 +23,26 @@ from ..shared.validation import (
 from ..shared.progress import progress
 
 
+@lru_cache(maxsize=16)
+def _package_pattern(pkg_names: Tuple[str, ...], driver_version: str, arch_suffix: str):
+    """Compile one pattern matching any of the packages for a driver version.
+
+    Groups: package name, driver major, package version.
+    """
+    driver_major = driver_version.split('.')[0]
+    if '.' not in driver_version:
+        # Major-only search: pkg-MAJOR_X.Y.Z-suffix_arch.deb
+        # Version format: X.Y.Z-Nubuntu... (stops before underscore)
+        version = r'\d+\.\d+\.\d+'
+    else:
+        # Exact version search: pkg-MAJOR_VERSION-suffix_arch.deb
+        version = re.escape(driver_version)
+    names = '|'.join(re.escape(name) for name in pkg_names)
+    return re.compile(
+        rf'({names})-({re.escape(driver_major)})_({version}-[0-9a-z.]+)_{re.escape(arch_suffix)}\.deb'
+    )
+
+
 @dataclass
 class PackageInfo:
     """Information about a found package."""
@@ -107,6 +127,18 @@ Examples:
             default='ubuntu2204',
             help='OS version string (default: ubuntu2204). Format: {distro}{version} e.g., ubuntu2204, debian12, rhel9'
         )
+        optional_group.add_argument(
+            '--no-cache',
+            action='store_true',
+            help='Always download the repository listing instead of using the local cache'
+        )
+        optional_group.add_argument(
+            '--cache-ttl',
+            type=int,
+            default=CACHE_TTL_SECONDS,
+            metavar='SECONDS',
+            help=f'How long to reuse a cached listing the server sent without ETag/Last-Modified (default: {CACHE_TTL_SECONDS})'
+        )
 
         # Output options
         output_group = parser.add_argument_group('Output Options')
@@ -156,12 +188,18 @@ Examples:
                 )
                 formatter.print_status(f"Repository: {repo_url}", 'info')
 
-            # Fetch repository listing
+            # Stream the repository listing and search all requested packages in one pass
             try:
-                with progress("Fetching repository listing", not args.quiet):
-                    html_content = self._fetch_repo_listing(repo_url)
-            except urllib.error.HTTPError as e:
-                if e.code == 404:
+                with progress("Searching repository listing", not args.quiet):
+                    # Shares its cache entry with the driver resolver used by align
+                    cache_key = None if args.no_cache else listing_cache_key(os_version, arch_map['path'])
+                    packages = self._search_packages(
+                        iter_listing_lines(repo_url, cache_key, args.cache_ttl),
+                        [self.PACKAGE_TYPES[pkg_type] for pkg_type in package_types],
+                        driver_version, arch_map['suffix'], repo_url
+                    )
+            except requests.HTTPError as e:
+                if e.response.status_code == 404:
                     formatter.print_status(
                         f"OS version '{os_version}' not found in NVIDIA repository", 'error'
                     )
@@ -171,23 +209,13 @@ Examples:
                     )
                 else:
                     formatter.print_status(
-                        f"HTTP error fetching repository: {e.code} {e.reason}", 'error'
+                        f"HTTP error fetching repository: {e.response.status_code} {e.response.reason}", 'error'
                     )
                 return 1
-            except urllib.error.URLError as e:
-                formatter.print_status(f"Network error: {e.reason}", 'error')
+            except requests.RequestException as e:
+                formatter.print_status(f"Network error: {e}", 'error')
                 return 1
 
-            # Search for packages
-            packages = []
-            for pkg_type in package_types:
-                pkg_name = self.PACKAGE_TYPES[pkg_type]
-                found = self._search_packages(
-                    html_content, pkg_name, driver_version,
-                    arch_map['suffix'], repo_url
-                )
-                packages.extend(found)
-
             if not packages:
                 formatter.print_status(
                     f"No packages found for driver version {driver_version}", 'warning'
@@ -207,65 +235,40 @@ Examples:
                 print(f"✗ Error: {e}")
             return 1
 
-    def _fetch_repo_listing(self, url: str) -> str:
-        """Fetch the HTML listing from the NVIDIA repository."""
-        request = urllib.request.Request(
-            url,
-            headers={'User-Agent': 'eks-nvidia-tools/1.0'}
-        )
-        with urllib.request.urlopen(request, timeout=30) as response:
-            return response.read().decode('utf-8')
-
     def _search_packages(
         self,
-        html_content: str,
-        pkg_name: str,
+        listing_lines: Iterable[str],
+        pkg_names: List[str],
         driver_version: str,
         arch_suffix: str,
         repo_url: str
     ) -> List[PackageInfo]:
-        """Search HTML content for matching packages."""
-        packages = []
+        """Search listing lines for matching packages, grouped in pkg_names order."""
+        found = {pkg_name: [] for pkg_name in pkg_names}
         seen = set()
 
-        # If driver_version is just major version (e.g., 570),
-        # search for any packages with that major version
-        if '.' not in driver_version:
-            # Pattern for major-only search: pkg-MAJOR_X.Y.Z-suffix_arch.deb
-            # Version format: X.Y.Z-Nubuntu... (stops before underscore)
-            pattern = rf'{re.escape(pkg_name)}-{re.escape(driver_version)}_(\d+\.\d+\.\d+-[0-9a-z.]+)_{re.escape(arch_suffix)}\.deb'
-            matches = re.findall(pattern, html_content)
-
-            for version in matches:
-                key = (pkg_name, driver_version, version)
-                if key not in seen:
-                    seen.add(key)
-                    filename = f"{pkg_name}-{driver_version}_{version}_{arch_suffix}.deb"
-                    packages.append(PackageInfo(
-                        name=f"{pkg_name}-{driver_version}",
-                        version=version,
-                        arch=arch_suffix,
-                        url=f"{repo_url}{filename}"
-                    ))
-        else:
-            # Exact version search: pkg-MAJOR_VERSION-suffix_arch.deb
-            driver_major = driver_version.split('.')[0]
-            pattern = rf'{re.escape(pkg_name)}-{re.escape(driver_major)}_({re.escape(driver_version)}-[0-9a-z.]+)_{re.escape(arch_suffix)}\.deb'
-            matches = re.findall(pattern, html_content)
-
-            for version in matches:
-                key = (pkg_name, driver_major, version)
-                if key not in seen:
-                    seen.add(key)
-                    filename = f"{pkg_name}-{driver_major}_{version}_{arch_suffix}.deb"
-                    packages.append(PackageInfo(
-                        name=f"{pkg_name}-{driver_major}",
-                        version=version,
-                        arch=arch_suffix,
-                        url=f"{repo_url}{filename}"
-                    ))
-
-        return packages
+        pattern = _package_pattern(tuple(pkg_names), driver_version, arch_suffix)
+        # Every match contains "-MAJOR_", so lines without it never reach the regex engine
+        needle = f"-{driver_version.split('.')[0]}_"
+        for line in listing_lines:
+            if needle not in line:
+                continue
+            for match in pattern.finditer(line):
+                key = match.groups()
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                pkg_name, driver_major, version = key
+                filename = f"{pkg_name}-{driver_major}_{version}_{arch_suffix}.deb"
+                found[pkg_name].append(PackageInfo(
+                    name=f"{pkg_name}-{driver_major}",
+                    version=version,
+                    arch=arch_suffix,
+                    url=f"{repo_url}{filename}"
+                ))
+
+        return [package for pkg_name in pkg_names for package in found[pkg_name]]
 
     def _output_results(
         self,
@@ -274,7 +277,7 @@ Examples:
         formatter: OutputFormatter
     ) -> None:
         """Output results in the requested format."""
-        if output_format == 'json':
+        if output_format in ('json', 'yaml'):
             data = [
                 {
                     'package': p.name,
@@ -284,24 +287,16 @@ Examples:
                 }
                 for p in packages
             ]
-            print(json.dumps(data, indent=2))
-
-        elif output_format == 'yaml':
-            data = [
-                {
-                    'package': p.name,
-                    'version': p.version,
-                    'arch': p.arch,
-                    'url': p.url
-                }
-                for p in packages
-            ]
-            print(yaml.dump(data, default_flow_style=False, sort_keys=False))
+            if output_format == 'json':
+                # Decode rather than writing bytes, so output still works when stdout has no binary buffer
+                print(json_utils.dumps(data, indent=True).decode('utf-8'))
+            else:
+                import yaml
+                print(yaml.dump(data, default_flow_style=False, sort_keys=False))
 
         else:  # table
-            rows = [
-                [p.name, p.version, p.arch, p.url]
-                for p in packages
-            ]
+            from tabulate import tabulate
+            # Rows are produced lazily; tabulate consumes the generator directly
+            rows = ((p.name, p.version, p.arch, p.url) for p in packages)
             headers = ['Package', 'Version', 'Arch', 'URL']
             print(tabulate(rows, headers=headers, tablefmt='grid'))
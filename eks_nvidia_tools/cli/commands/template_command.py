@@ -16,6 +16,7 @@ from models.ami_types import Architecture
 
 from ..shared.arguments import add_architecture_args, add_output_args, add_aws_args
 from utils.path_utils import get_output_path
+from utils import json_utils
 from ..shared.output import OutputFormatter
 from ..shared.validation import (
     validate_architecture, validate_aws_region, validate_aws_profile, ValidationError
@@ -279,8 +280,8 @@ Examples:
             
             # Load template
             with progress(f"Loading template {args.validate}", not args.quiet):
-                with open(args.validate, 'r') as f:
-                    template = json.load(f)
+                with open(args.validate, 'rb') as f:
+                    template = json_utils.loads(f.read())
             
             # Validate template
             with progress("Validating template structure", not args.quiet):
@@ -107,6 +107,20 @@ class EKSNvidiaToolsCLI:
 
         return parser
     
+    def populate_parsers(self, argv) -> None:
+        """
+        Finish building the subcommand parsers this invocation can reach.
+        
+        Commands with a populate_parser() method defer adding their options
+        until needed. Only the commands named on the command line are
+        populated; when none is named (e.g. top-level --help) all of them are.
+        """
+        selected = [name for name in self.commands if name in argv] or list(self.commands)
+        for name in selected:
+            populate = getattr(self.commands[name], 'populate_parser', None)
+            if populate is not None:
+                populate()
+    
     def dispatch_command(self, args: argparse.Namespace) -> int:
         """Dispatch to the appropriate command handler."""
         if not args.command:
@@ -133,7 +147,10 @@ class EKSNvidiaToolsCLI:
     
     def run(self, argv=None) -> int:
         """Run the CLI with the given arguments."""
+        if argv is None:
+            argv = sys.argv[1:]
         parser = self.create_parser()
+        self.populate_parsers(argv)
         args = parser.parse_args(argv)
         return self.dispatch_command(args)
 
@@ -2,13 +2,23 @@
 Output formatting utilities for EKS NVIDIA Tools CLI
 """
 
+import io
 import json
-import yaml
-from typing import Any, Dict, List, Optional, Tuple
-from tabulate import tabulate
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from models.ami_types import AMIType, AMITypeManager
 
 
+_STATUS_PREFIXES = {
+    'info': 'ℹ',
+    'success': '✓',
+    'warning': '⚠',
+    'error': '✗'
+}
+
+
 class OutputFormatter:
     """Handles consistent output formatting across all commands."""
     
@@ -23,6 +33,8 @@ class OutputFormatter:
         self.format_type = format_type
         self.quiet = quiet
         self.ami_manager = AMITypeManager()
+        # Status lines may come from worker threads; keep each one whole
+        self._lock = threading.Lock()
     
     def print_alignment_results(self, alignment: Any) -> None:
         """Print driver alignment results in the specified format."""
@@ -73,17 +85,32 @@ class OutputFormatter:
     
     def print_status(self, message: str, level: str = 'info') -> None:
         """Print status messages unless in quiet mode."""
+        line = self._format_status(message, level)
+        if line is not None:
+            with self._lock:
+                print(line)
+    
+    def print_status_batch(self, messages: List[Tuple[str, str]]) -> None:
+        """Print several (message, level) status lines with a single write."""
+        lines = [self._format_status(message, level) for message, level in messages]
+        lines = [line for line in lines if line is not None]
+        if lines:
+            with self._lock:
+                print("\n".join(lines))
+    
+    def print_captured(self, text: str) -> None:
+        """Print output captured from a worker thread as one uninterrupted block."""
+        if text:
+            with self._lock:
+                print(text, end='')
+    
+    def _format_status(self, message: str, level: str) -> Optional[str]:
+        """Format a status line, or return None if quiet mode suppresses it."""
         if self.quiet and level == 'info':
-            return
-        
-        prefix = {
-            'info': 'ℹ',
-            'success': '✓',
-            'warning': '⚠',
-            'error': '✗'
-        }.get(level, '')
+            return None
         
-        print(f"{prefix} {message}" if prefix else message)
+        prefix = _STATUS_PREFIXES.get(level, '')
+        return f"{prefix} {message}" if prefix else message
     
     def _print_json(self, data: Any) -> None:
         """Print data as JSON."""
@@ -91,10 +118,12 @@ class OutputFormatter:
     
     def _print_yaml(self, data: Any) -> None:
         """Print data as YAML."""
+        import yaml
         print(yaml.dump(data, default_flow_style=False, sort_keys=False))
     
     def _print_alignment_table(self, alignment: Any) -> None:
         """Print alignment results as a formatted table."""
+        from tabulate import tabulate
         headers = ['Property', 'Value']
         
         # Get AMI type to check for deprecation
@@ -132,6 +161,7 @@ class OutputFormatter:
     
     def _print_ami_table_with_grouping(self, grouped_results: List[Dict[str, Any]]) -> None:
         """Print grouped AMI results showing both AL2 and AL2023 versions."""
+        from tabulate import tabulate
         if not grouped_results:
             return
         
@@ -182,6 +212,7 @@ class OutputFormatter:
     
     def _print_ami_table(self, results: List[tuple]) -> None:
         """Print AMI results as a formatted table."""
+        from tabulate import tabulate
         if not results:
             return
         
@@ -314,4 +345,50 @@ class OutputFormatter:
                 'package': ami_tuple[2]
             }
         else:
-            return {f'field_{i+1}': value for i, value in enumerate(ami_tuple)}
\ No newline at end of file
+            return {f'field_{i+1}': value for i, value in enumerate(ami_tuple)}
+
+
+class ThreadOutputCapture:
+    """
+    Collect print() output per worker thread so concurrent tasks don't interleave.
+    
+    While active, sys.stdout is replaced by this object. Threads inside capture()
+    write to their own buffer; every other thread writes straight through.
+    """
+    
+    def __init__(self):
+        self._stdout = None
+        self._buffers: Dict[int, io.StringIO] = {}
+    
+    def __enter__(self) -> 'ThreadOutputCapture':
+        self._stdout = sys.stdout
+        sys.stdout = self
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        sys.stdout = self._stdout
+    
+    @contextmanager
+    def capture(self) -> Iterator[io.StringIO]:
+        """Buffer the calling thread's output for the duration of the block."""
+        ident = threading.get_ident()
+        buffer = io.StringIO()
+        self._buffers[ident] = buffer
+        try:
+            yield buffer
+        finally:
+            del self._buffers[ident]
+    
+    def write(self, text: str) -> int:
+        buffer = self._buffers.get(threading.get_ident())
+        if buffer is not None:
+            return buffer.write(text)
+        return self._stdout.write(text)
+    
+    def flush(self) -> None:
+        if threading.get_ident() not in self._buffers:
+            self._stdout.flush()
+    
+    def __getattr__(self, name: str) -> Any:
+        # Anything else (encoding, isatty, ...) comes from the real stream
+        return getattr(self._stdout, name)
@@ -6,6 +6,16 @@ import re
 from typing import List, Optional
 
 
+_K8S_VERSION_RE = re.compile(r'^(\d+)\.(\d+)$')
+# NVIDIA driver versions can be in format: XXX, XXX.XX or XXX.XX.XX
+_DRIVER_VERSION_FULL_RE = re.compile(r'^(\d{3})\.(\d{2,3})(?:\.(\d{2}))?$')
+_DRIVER_VERSION_MAJOR_RE = re.compile(r'^(\d{3})$')
+_CLUSTER_NAME_RE = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?$')
+_AWS_REGION_RE = re.compile(r'^[a-z]{2}-[a-z]+-\d+$')
+_AWS_PROFILE_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+_OS_VERSION_RE = re.compile(r'^(ubuntu|debian|rhel)\d+$')
+
+
 class ValidationError(Exception):
     """Custom exception for validation errors."""
     pass
@@ -31,8 +41,7 @@ def validate_k8s_version(version: str) -> str:
     version = version.lstrip('v')
     
     # Basic format validation: X.Y where X and Y are integers
-    pattern = r'^(\d+)\.(\d+)$'
-    match = re.match(pattern, version)
+    match = _K8S_VERSION_RE.match(version)
     
     if not match:
         raise ValidationError(
@@ -105,18 +114,11 @@ def validate_driver_version(version: str) -> str:
     if not version:
         raise ValidationError("Driver version cannot be empty")
     
-    # NVIDIA driver versions can be in format: XXX, XXX.XX or XXX.XX.XX
     # Support major-only versions for broader searches
-    pattern_full = r'^(\d{3})\.(\d{2,3})(?:\.(\d{2}))?$'
-    pattern_major = r'^(\d{3})$'
+    match = _DRIVER_VERSION_FULL_RE.match(version) or _DRIVER_VERSION_MAJOR_RE.match(version)
     
-    match_full = re.match(pattern_full, version)
-    match_major = re.match(pattern_major, version)
-    
-    if match_full:
-        major = int(match_full.group(1))
-    elif match_major:
-        major = int(match_major.group(1))
+    if match:
+        major = int(match.group(1))
     else:
         raise ValidationError(
             f"Invalid NVIDIA driver version format: {version}. "
@@ -151,9 +153,7 @@ def validate_cluster_name(name: str) -> str:
     
     # EKS cluster names must be 1-100 characters and can contain letters,
     # numbers, and hyphens, but cannot start or end with hyphen
-    pattern = r'^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?$'
-    
-    if not re.match(pattern, name):
+    if not _CLUSTER_NAME_RE.match(name):
         raise ValidationError(
             f"Invalid EKS cluster name: {name}. "
             "Cluster names must contain only letters, numbers, and hyphens, "
@@ -186,9 +186,7 @@ def validate_aws_region(region: str) -> str:
         raise ValidationError("AWS region cannot be empty")
     
     # Basic AWS region format validation
-    pattern = r'^[a-z]{2}-[a-z]+-\d+$'
-    
-    if not re.match(pattern, region):
+    if not _AWS_REGION_RE.match(region):
         raise ValidationError(
             f"Invalid AWS region format: {region}. "
             "Expected format: us-east-1, eu-west-1, etc."
@@ -214,9 +212,7 @@ def validate_aws_profile(profile: str) -> str:
         raise ValidationError("AWS profile cannot be empty")
     
     # AWS profile names can contain letters, numbers, hyphens, and underscores
-    pattern = r'^[a-zA-Z0-9_-]+$'
-    
-    if not re.match(pattern, profile):
+    if not _AWS_PROFILE_RE.match(profile):
         raise ValidationError(
             f"Invalid AWS profile name: {profile}. "
             "Profile names can only contain letters, numbers, hyphens, and underscores"
@@ -266,9 +262,7 @@ def validate_os_version(os_version: str) -> str:
         raise ValidationError("OS version cannot be empty")
 
     # Pattern: {distro}{version} where distro is ubuntu, debian, or rhel
-    pattern = r'^(ubuntu|debian|rhel)\d+$'
-
-    if not re.match(pattern, os_version.lower()):
+    if not _OS_VERSION_RE.match(os_version.lower()):
         raise ValidationError(
             f"Invalid OS version format: {os_version}. "
             "Expected format: {distro}{version} (e.g., ubuntu2204, debian12, rhel9). "
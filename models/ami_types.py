@@ -3,10 +3,29 @@ AMI Type definitions and architecture mappings for EKS.
 """
 
 from enum import Enum
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Tuple
 from dataclasses import dataclass
 
 
+# Last Kubernetes version with AL2 AMI support, as a comparable (major, minor) tuple
+AL2_LAST_K8S_TUPLE = (1, 32)
+
+
+@lru_cache(maxsize=256)
+def version_tuple(version: str) -> Tuple[int, ...]:
+    """Parse a dotted numeric version (e.g. "1.32") into a comparable tuple (1, 32)."""
+    return tuple(int(part) for part in version.split('.'))
+
+
+def is_al2_supported_version(k8s_version: str) -> bool:
+    """Check if AL2 AMIs are still supported for the given Kubernetes version."""
+    try:
+        return version_tuple(k8s_version) <= AL2_LAST_K8S_TUPLE
+    except (ValueError, AttributeError, TypeError):
+        return False
+
+
 class AMIType(Enum):
     """EKS AMI types with their exact string representations."""
     AL2023_X86_64_NVIDIA = "AL2023_x86_64_NVIDIA"
@@ -82,7 +101,6 @@ class AMITypeManager:
     
     # AL2 End-of-Life Information
     AL2_EOL_DATE = "2024-11-26"
-    AL2_LAST_K8S_VERSION = "1.32"
     
     def __init__(self):
         self._compatibility_matrix = self._build_compatibility_matrix()
@@ -142,12 +160,7 @@ class AMITypeManager:
     
     def is_al2_supported(self, k8s_version: str) -> bool:
         """Check if AL2 AMIs are still supported for the given Kubernetes version."""
-        try:
-            version_parts = [int(x) for x in k8s_version.split('.')]
-            last_supported = [int(x) for x in self.AL2_LAST_K8S_VERSION.split('.')]
-            return version_parts <= last_supported
-        except (ValueError, IndexError):
-            return False
+        return is_al2_supported_version(k8s_version)
     
     def get_compatibility_info(self, ami_type: AMIType) -> AMICompatibility:
         """Get detailed compatibility information for an AMI type."""
@@ -2,8 +2,8 @@
 Driver alignment models and data structures - FIXED VERSION
 """
 
-from dataclasses import dataclass
-from typing import Dict, List
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
 from models.ami_types import Architecture, AMIType
 
 
@@ -25,6 +25,16 @@ class DriverAlignment:
     formatted_driver_version: str  # For container builds (e.g., "570_570.148.08-1.ubuntu2204")
     deb_urls: List[str]
     nodegroup_config: Dict
+    # (package_name, url) pairs for the .deb URLs that were found
+    deb_packages: List[Tuple[str, str]] = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        """Derive package names from the found .deb URLs once."""
+        self.deb_packages = [
+            (url.rsplit('/', 1)[-1].split('_', 1)[0], url)
+            for url in self.deb_urls
+            if not url.startswith("# NOT FOUND")
+        ]
     
     @property
     def architecture_display(self) -> str:
@@ -59,14 +69,12 @@ class DriverAlignment:
             List of dictionaries with package_name and url keys
         """
         packages = []
-        for url in self.deb_urls:
-            if not url.startswith("# NOT FOUND"):
-                package_name = url.split('/')[-1].split('_')[0]
-                packages.append({
-                    'package_name': package_name,
-                    'url': url,
-                    'filename': url.split('/')[-1]
-                })
+        for package_name, url in self.deb_packages:
+            packages.append({
+                'package_name': package_name,
+                'url': url,
+                'filename': url.rsplit('/', 1)[-1]
+            })
         return packages
     
     def get_missing_packages(self) -> List[str]:
@@ -0,0 +1,54 @@
+"""JSON helpers that use orjson when it is installed, falling back to the standard library."""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document from text or bytes.
+
+    Invalid input raises json.JSONDecodeError with either backend.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON, optionally indented by two spaces.
+
+    Both backends produce the same bytes: non-ASCII text is written as raw UTF-8 and
+    unindented output has no spaces after separators.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def dump_to_file(path: Union[str, Path], obj: Any, indent: bool = True) -> None:
+    """Serialize an object and atomically replace a file with it.
+
+    The JSON goes to a per-thread sibling temp file that is then renamed over the
+    target, so readers and concurrent writers never see a partially written file.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_bytes(dumps(obj, indent=indent))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
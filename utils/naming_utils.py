@@ -20,6 +20,9 @@ def generate_nodegroup_name(base_name: str) -> str:
 
 def strip_nodegroup_suffix(name: str) -> str:
     """Strip auto-generated suffix (timestamp or hex) from a nodegroup name."""
-    name = _TIMESTAMP_SUFFIX_RE.sub('', name)
-    name = _HEX_SUFFIX_RE.sub('', name)
+    # Probe the fixed separator positions first; most names have no suffix to strip
+    if len(name) >= 20 and name[-20] == '-' and name[-9] == 'T':
+        name = _TIMESTAMP_SUFFIX_RE.sub('', name)
+    if len(name) >= 5 and name[-5] == '-':
+        name = _HEX_SUFFIX_RE.sub('', name)
     return name
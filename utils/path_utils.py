@@ -2,6 +2,7 @@
 Path utilities for EKS NVIDIA Tools
 """
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -38,6 +39,13 @@ def get_cache_path(filename: str) -> str:
 
 def find_template_file(template_name: str = "nodegroup_template.json") -> Optional[str]:
     """Find template file, checking multiple locations."""
+    # Lookups are relative, so the answer is cached per working directory
+    return _find_template_file(template_name, os.getcwd())
+
+
+@lru_cache(maxsize=8)
+def _find_template_file(template_name: str, cwd: str) -> Optional[str]:
+    """Search the template locations relative to cwd (the current directory)."""
     # Check new templates folder first
     template_path = get_template_path(template_name)
     if os.path.exists(template_path):